@@ -5,6 +5,7 @@ This module handles database connections and operations.
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 import sqlalchemy
 from sqlalchemy import create_engine, text, MetaData
@@ -23,23 +24,34 @@ class DatabaseOperations:
         self.config = config
         self.engine: Optional[Engine] = None
         self.connection = None
+        self._connect_lock = threading.Lock()
     
     def connect(self) -> None:
         """Establish database connection"""
         try:
             connection_string = self.config.get_connection_string()
-            self.engine = create_engine(connection_string, echo=False)
+            self.engine = create_engine(connection_string, **self.config.get_engine_options())
             
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             
-            logger.info(f"Connected to {self.config.db_type} database: {self.config.db_name}")
+            logger.info("Connected to %s database: %s", self.config.db_type, self.config.db_name)
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to connect to database: {e}")
+            logger.error("Failed to connect to database: %s", e)
             raise
     
+    def get_engine(self) -> Engine:
+        """Return the engine, connecting on first use (safe across worker threads)"""
+        engine = self.engine
+        if engine is None:
+            with self._connect_lock:
+                if self.engine is None:
+                    self.connect()
+                engine = self.engine
+        return engine
+    
     def disconnect(self) -> None:
         """Close database connection"""
         if self.engine:
@@ -49,11 +61,8 @@ class DatabaseOperations:
     
     def execute_query(self, query: str, limit: int = 1000) -> Dict[str, Any]:
         """Execute a SQL query and return results"""
-        if not self.engine:
-            raise RuntimeError("Database not connected")
-        
         try:
-            with self.engine.connect() as conn:
+            with self.get_engine().connect() as conn:
                 # Add LIMIT clause if not present and limit is specified
                 if limit and limit > 0 and "LIMIT" not in query.upper():
                     query = f"{query.rstrip(';')} LIMIT {limit}"
@@ -77,17 +86,14 @@ class DatabaseOperations:
                 }
                 
         except SQLAlchemyError as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             raise
     
     def get_schema_info(self) -> Dict[str, Any]:
         """Get database schema information"""
-        if not self.engine:
-            raise RuntimeError("Database not connected")
-        
         try:
             metadata = MetaData()
-            metadata.reflect(bind=self.engine)
+            metadata.reflect(bind=self.get_engine())
             
             schema_info = {
                 "tables": {},
@@ -113,16 +119,13 @@ class DatabaseOperations:
             return schema_info
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to get schema info: {e}")
+            logger.error("Failed to get schema info: %s", e)
             raise
     
     def health_check(self) -> Dict[str, Any]:
         """Perform database health check"""
-        if not self.engine:
-            return {"status": "disconnected", "error": "No database connection"}
-        
         try:
-            with self.engine.connect() as conn:
+            with self.get_engine().connect() as conn:
                 result = conn.execute(text("SELECT 1 as health_check"))
                 row = result.fetchone()
                 
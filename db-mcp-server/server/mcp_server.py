@@ -4,10 +4,18 @@ Database MCP Server module
 This module contains the main DatabaseMCPServer class.
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
+import orjson
+from cachetools import TTLCache
 from fastmcp import FastMCP
 
 from models.config import DatabaseConfig
@@ -16,6 +24,67 @@ from .schema_manager import SchemaManager
 
 logger = logging.getLogger(__name__)
 
+# Single read-only statements whose results may be served from the query cache
+_CACHEABLE_QUERY_RE = re.compile(r"^\s*(select|show|describe|desc|explain)\b", re.IGNORECASE)
+
+
+def _is_cacheable_query(query: str) -> bool:
+    """True for a single read-only statement"""
+    return bool(_CACHEABLE_QUERY_RE.match(query)) and ";" not in query.strip().rstrip(";")
+
+
+def _dumps(obj: Any, option: int = 0) -> str:
+    """Serialize an MCP payload to JSON with orjson"""
+    return orjson.dumps(obj, default=str, option=option).decode()
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """Format a UTC timestamp, at most once per wall-clock second"""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time in ISO 8601 at one-second resolution"""
+    return _iso_second(int(time.time()))
+
+
+# Prompt templates, advertised natively as MCP prompts and as prompts://database
+_PROMPT_TEMPLATES = {
+    "generate_sql_query": {
+        "description": "Generate SQL query from natural language",
+        "template": "Given the database schema and question, generate a SQL query.\n\nSchema:\n{schema}\n\nQuestion: {question}\n\nSQL Query:"
+    },
+    "explain_query": {
+        "description": "Explain what a SQL query does",
+        "template": "Explain what the following SQL query does:\n\n{query}\n\nExplanation:"
+    }
+}
+_PROMPT_TEMPLATES_JSON = _dumps(_PROMPT_TEMPLATES)
+
+
+_BANNER = """
+============================================================
+🗄️  Database MCP Server
+============================================================
+📊 Database: {db_type} - {db_name}
+🌐 Server: {host}:{port}
+📋 MCP Endpoint: http://{host}:{port}/mcp
+
+🔧 Available Tools:
+  • query_database - Execute SQL queries
+  • refresh_schema - Refresh database schema cache
+  • health_check - Check database connection health
+
+📚 Available Resources:
+  • database://schema - Database schema information
+  • server://info - Server information
+  • prompts://database - Database-related prompts
+
+🚀 Server is ready to accept connections!
+============================================================
+"""
+
 
 class DatabaseMCPServer:
     """
@@ -33,12 +102,24 @@ class DatabaseMCPServer:
     def __init__(self, config: Optional[DatabaseConfig] = None):
         self.config = config or DatabaseConfig()
         self.mcp = FastMCP(name="mysql-mcp-server")
-        self.request_id = 0  # For MCP request correlation
+        self._id_gen = itertools.count(1)  # For MCP request correlation
         
         # Initialize components
         self.db_ops = DatabaseOperations(self.config)
         self.schema_manager = SchemaManager(self.config, self.db_ops)
         
+        # Blocking database work runs on a pool sized to the connection pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.db_pool_size,
+            thread_name_prefix="db-worker"
+        )
+        
+        # Serialized results of read-only queries, keyed by the exact SQL text.
+        # The epoch is bumped by every write so a read that overlapped one
+        # doesn't store rows from before it.
+        self.query_cache = TTLCache(maxsize=512, ttl=self.config.query_cache_ttl)
+        self._query_cache_epoch = 0
+        
         # Setup logging
         logging.basicConfig(
             level=getattr(logging, self.config.log_level),
@@ -46,15 +127,24 @@ class DatabaseMCPServer:
         )
         self.logger = logging.getLogger("db_mcp_server")
         
-        # Register MCP tools and resources
+        # Register MCP tools, resources and prompts
         self._register_tools()
         self._register_resources()
-        self._register_lifecycle_handlers()
+        self._register_prompts()
+    
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached query results and fence off reads still in flight"""
+        self._query_cache_epoch += 1
+        self.query_cache.clear()
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking database call on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
     
     def create_mcp_response(self, content: Any, error: str = None, request_id: str = None) -> dict:
         """Create MCP-compliant response format"""
-        self.request_id += 1
-        response_id = request_id or str(self.request_id)
+        response_id = request_id or str(next(self._id_gen))
         
         if error:
             return {
@@ -75,6 +165,11 @@ class DatabaseMCPServer:
                 }
             }
     
+    def create_mcp_response_json(self, content_json: str, request_id: str = None) -> str:
+        """Serialize a success response around content that is already JSON"""
+        response_id = request_id or str(next(self._id_gen))
+        return f'{{"jsonrpc":"2.0","id":{_dumps(response_id)},"result":{{"content":{content_json}}}}}'
+    
     def _register_tools(self):
         """Register MCP tools"""
         
@@ -82,29 +177,41 @@ class DatabaseMCPServer:
         async def query_database(query: str, limit: int = 1000) -> str:
             """Execute a SQL query on the database"""
             try:
-                self.logger.info(f"Executing query: {query[:100]}...")
+                self.logger.info("Executing query: %.100s...", query)
                 
-                # Connect if not already connected
-                if not self.db_ops.engine:
-                    self.db_ops.connect()
+                # Serve repeated read-only queries (including empty results) from
+                # the cache; anything else may change data, so it drops the cache
+                cache_key = (query.strip(), limit)
+                cacheable = _is_cacheable_query(query)
+                if cacheable:
+                    cached = self.query_cache.get(cache_key)
+                    if cached is not None:
+                        return self.create_mcp_response_json(cached)
+                epoch = self._query_cache_epoch
                 
                 # Execute query
-                result = self.db_ops.execute_query(query, limit)
+                try:
+                    result = await self._run_blocking(self.db_ops.execute_query, query, limit)
+                finally:
+                    if not cacheable:
+                        self._invalidate_query_cache()
+                self.schema_manager.invalidate_on_ddl(query)
                 
                 # Create MCP response
-                response = self.create_mcp_response({
+                content_json = _dumps({
                     "data": result["data"],
                     "row_count": result["row_count"],
                     "columns": result["columns"],
                     "query": result["query"]
                 })
-                
-                return json.dumps(response)
+                if cacheable and epoch == self._query_cache_epoch:
+                    self.query_cache[cache_key] = content_json
+                return self.create_mcp_response_json(content_json)
                 
             except Exception as e:
-                self.logger.error(f"Query execution failed: {e}")
+                self.logger.error("Query execution failed: %s", e)
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def refresh_schema() -> str:
@@ -112,51 +219,40 @@ class DatabaseMCPServer:
             try:
                 self.logger.info("Refreshing database schema")
                 
-                # Connect if not already connected
-                if not self.db_ops.engine:
-                    self.db_ops.connect()
-                
-                # Refresh schema
-                schema = self.schema_manager.refresh_schema()
+                # Refresh schema; cached query results may predate the change
+                self._invalidate_query_cache()
+                schema = await self._run_blocking(self.schema_manager.refresh_schema)
                 
-                response = self.create_mcp_response({
+                return self.create_mcp_response_json(_dumps({
                     "message": "Schema refreshed successfully",
                     "schema_length": len(schema),
-                    "cached_at": datetime.now(timezone.utc).isoformat()
-                })
-                
-                return json.dumps(response)
+                    "cached_at": _utc_now_iso()
+                }))
                 
             except Exception as e:
-                self.logger.error(f"Schema refresh failed: {e}")
+                self.logger.error("Schema refresh failed: %s", e)
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def health_check() -> str:
             """Check database connection health"""
             try:
-                # Connect if not already connected
-                if not self.db_ops.engine:
-                    self.db_ops.connect()
-                
                 # Perform health check
-                health = self.db_ops.health_check()
+                health = await self._run_blocking(self.db_ops.health_check)
                 
-                response = self.create_mcp_response({
+                return self.create_mcp_response_json(_dumps({
                     "status": health["status"],
                     "database": self.config.db_name,
                     "database_type": self.config.db_type,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": _utc_now_iso(),
                     "error": health.get("error")
-                })
-                
-                return json.dumps(response)
+                }))
                 
             except Exception as e:
-                self.logger.error(f"Health check failed: {e}")
+                self.logger.error("Health check failed: %s", e)
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
     
     def _register_resources(self):
         """Register MCP resources"""
@@ -165,157 +261,54 @@ class DatabaseMCPServer:
         async def get_database_schema() -> str:
             """Get the database schema"""
             try:
-                schema = self.schema_manager.get_schema()
+                schema = await self._run_blocking(self.schema_manager.get_schema)
                 return schema
             except Exception as e:
-                self.logger.error(f"Failed to get schema: {e}")
+                self.logger.error("Failed to get schema: %s", e)
                 return f"Error retrieving database schema: {str(e)}"
         
+        # Only the timestamp of server://info changes between reads
+        server_info = {
+            "name": "Database MCP Server",
+            "version": "1.0.0",
+            "database_type": self.config.db_type,
+            "database_name": self.config.db_name,
+            "server_host": self.config.server_host,
+            "server_port": self.config.server_port
+        }
+        
         @self.mcp.resource("server://info")
         async def get_server_info() -> str:
             """Get server information"""
             try:
-                info = {
-                    "name": "Database MCP Server",
-                    "version": "1.0.0",
-                    "database_type": self.config.db_type,
-                    "database_name": self.config.db_name,
-                    "server_host": self.config.server_host,
-                    "server_port": self.config.server_port,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
-                return json.dumps(info, indent=2)
+                info = {**server_info, "timestamp": _utc_now_iso()}
+                return _dumps(info)
             except Exception as e:
-                self.logger.error(f"Failed to get server info: {e}")
+                self.logger.error("Failed to get server info: %s", e)
                 return f"Error retrieving server info: {str(e)}"
         
         @self.mcp.resource("prompts://database")
         async def get_database_prompts() -> str:
             """Get database-related prompts"""
-            try:
-                prompts = {
-                    "generate_sql_query": {
-                        "description": "Generate SQL query from natural language",
-                        "template": "Given the database schema and question, generate a SQL query.\n\nSchema:\n{schema}\n\nQuestion: {question}\n\nSQL Query:"
-                    },
-                    "explain_query": {
-                        "description": "Explain what a SQL query does",
-                        "template": "Explain what the following SQL query does:\n\n{query}\n\nExplanation:"
-                    }
-                }
-                return json.dumps(prompts, indent=2)
-            except Exception as e:
-                self.logger.error(f"Failed to get prompts: {e}")
-                return f"Error retrieving prompts: {str(e)}"
+            return _PROMPT_TEMPLATES_JSON
     
-    def _register_lifecycle_handlers(self):
-        """Register MCP lifecycle handlers"""
+    def _register_prompts(self):
+        """Register MCP prompts (listed through the protocol's native prompts/list)"""
         
-        @self.mcp.tool()
-        async def list_tools() -> str:
-            """List available MCP tools"""
-            try:
-                tools = {
-                    "query_database": {
-                        "name": "query_database",
-                        "description": "Execute SQL queries on the database",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string", "description": "SQL query to execute"},
-                                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 1000}
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    "refresh_schema": {
-                        "name": "refresh_schema",
-                        "description": "Refresh the database schema cache",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    "health_check": {
-                        "name": "health_check",
-                        "description": "Check database connection health",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    }
-                }
-                
-                response = self.create_mcp_response(tools)
-                return json.dumps(response)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to list tools: {e}")
-                error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
-        
-        @self.mcp.tool()
-        async def list_resources() -> str:
-            """List available MCP resources"""
-            try:
-                resources = {
-                    "database://schema": {
-                        "uri": "database://schema",
-                        "name": "Database Schema",
-                        "description": "Current database schema information",
-                        "mimeType": "text/plain"
-                    },
-                    "server://info": {
-                        "uri": "server://info",
-                        "name": "Server Information",
-                        "description": "MCP server information and status",
-                        "mimeType": "application/json"
-                    },
-                    "prompts://database": {
-                        "uri": "prompts://database",
-                        "name": "Database Prompts",
-                        "description": "Available database-related prompts",
-                        "mimeType": "application/json"
-                    }
-                }
-                
-                response = self.create_mcp_response(resources)
-                return json.dumps(response)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to list resources: {e}")
-                error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+        @self.mcp.prompt()
+        async def generate_sql_query(question: str, table_context: str = "") -> str:
+            """Generate SQL query from natural language question"""
+            schema = await self._run_blocking(self.schema_manager.get_schema)
+            if table_context:
+                schema = f"{schema}\n\n{table_context}"
+            return _PROMPT_TEMPLATES["generate_sql_query"]["template"].format(
+                schema=schema, question=question
+            )
         
-        @self.mcp.tool()
-        async def list_prompts() -> str:
-            """List available MCP prompts"""
-            try:
-                prompts = {
-                    "generate_sql_query": {
-                        "name": "generate_sql_query",
-                        "description": "Generate SQL query from natural language question",
-                        "arguments": [
-                            {"name": "question", "description": "Natural language question about the database", "required": True},
-                            {"name": "table_context", "description": "Additional table context", "required": False}
-                        ]
-                    },
-                    "explain_query": {
-                        "name": "explain_query",
-                        "description": "Explain what a SQL query does",
-                        "arguments": [
-                            {"name": "query", "description": "SQL query to explain", "required": True}
-                        ]
-                    }
-                }
-                
-                response = self.create_mcp_response(prompts)
-                return json.dumps(response)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to list prompts: {e}")
-                error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+        @self.mcp.prompt()
+        async def explain_query(query: str) -> str:
+            """Explain what a SQL query does"""
+            return _PROMPT_TEMPLATES["explain_query"]["template"].format(query=query)
     
     def start(self):
         """Start the MCP server"""
@@ -333,7 +326,7 @@ class DatabaseMCPServer:
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to start server: {e}")
+            self.logger.error("Failed to start server: %s", e)
             raise
     
     async def stop(self):
@@ -343,27 +336,19 @@ class DatabaseMCPServer:
             
             # Disconnect from database
             self.db_ops.disconnect()
+            self._executor.shutdown(wait=False)
             
             self.logger.info("Server stopped successfully")
             
         except Exception as e:
-            self.logger.error(f"Error stopping server: {e}")
+            self.logger.error("Error stopping server: %s", e)
     
     def print_server_info(self):
         """Print server information"""
-        print("\n" + "="*60)
-        print("🗄️  Database MCP Server")
-        print("="*60)
-        print(f"📊 Database: {self.config.db_type.upper()} - {self.config.db_name}")
-        print(f"🌐 Server: {self.config.server_host}:{self.config.server_port}")
-        print(f"📋 MCP Endpoint: http://{self.config.server_host}:{self.config.server_port}/mcp")
-        print("\n🔧 Available Tools:")
-        print("  • query_database - Execute SQL queries")
-        print("  • refresh_schema - Refresh database schema cache")
-        print("  • health_check - Check database connection health")
-        print("\n📚 Available Resources:")
-        print("  • database://schema - Database schema information")
-        print("  • server://info - Server information")
-        print("  • prompts://database - Database-related prompts")
-        print("\n🚀 Server is ready to accept connections!")
-        print("="*60)
+        sys.stdout.write(_BANNER.format(
+            db_type=self.config.db_type.upper(),
+            db_name=self.config.db_name,
+            host=self.config.server_host,
+            port=self.config.server_port
+        ))
+        sys.stdout.flush()
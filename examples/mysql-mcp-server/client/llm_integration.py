@@ -4,42 +4,82 @@ LLM Integration module
 This module handles LLM initialization and integration logic.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
+from cachetools import LRUCache
 from models.config import MCPClientConfig
 
 logger = logging.getLogger(__name__)
 
+# Resolve the optional NailLLMLangchain dependency once at import
+try:
+    from nail_client.flow import NailRAGFlow
+    from nail_client.nail_llm import NailLLMLangchain
+    _HAS_NAIL_CLIENT = True
+except ImportError:
+    _HAS_NAIL_CLIENT = False
+
 
 class LLMIntegration:
     """Handles LLM initialization and integration"""
     
+    _instances: Dict[Tuple, "LLMIntegration"] = {}
+    
+    @staticmethod
+    def _config_key(config: MCPClientConfig) -> Tuple:
+        return (
+            config.google_api_key,
+            config.gemini_model_id,
+            config.nail_model_id,
+            config.nail_temperature,
+            config.nail_max_tokens,
+            config.llm_max_concurrency
+        )
+    
+    @classmethod
+    def shared(cls, config: MCPClientConfig) -> "LLMIntegration":
+        """Return the process-wide instance for this LLM configuration, creating it on first use"""
+        key = cls._config_key(config)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = cls(config)
+        return instance
+    
     def __init__(self, config: MCPClientConfig):
         self.config = config
         self.llm_instance = None
         self._has_nail_llm = False
+        # Bounds in-flight LLM calls so a burst of requests can't exhaust threads or quota
+        self._semaphore = asyncio.Semaphore(config.llm_max_concurrency)
+        # Identical prompts (same schema and question) reuse the earlier completion
+        self._response_cache = LRUCache(maxsize=256)
     
     async def initialize(self) -> None:
-        """Initialize LLM instance"""
-        try:
-            # Try to import and initialize NailLLMLangchain
-            from nail_client.flow import NailRAGFlow
-            from nail_client.nail_llm import NailLLMLangchain
-            
-            logger.info("Initializing NailLLMLangchain...")
-            rag_flow = NailRAGFlow()
-            
-            self.llm_instance = NailLLMLangchain(
-                model_id=self.config.nail_model_id,
-                temperature=self.config.nail_temperature,
-                max_tokens=self.config.nail_max_tokens,
-                api_key=rag_flow.access_token
-            )
-            
-            self._has_nail_llm = True
-            logger.info(f"✅ NailLLMLangchain initialized successfully with model: {self.config.nail_model_id}")
-            
-        except ImportError:
+        """Initialize LLM instance (no-op if already initialized)"""
+        if self.llm_instance is not None:
+            return
+        
+        if _HAS_NAIL_CLIENT:
+            try:
+                logger.info("Initializing NailLLMLangchain...")
+                rag_flow = NailRAGFlow()
+                
+                self.llm_instance = NailLLMLangchain(
+                    model_id=self.config.nail_model_id,
+                    temperature=self.config.nail_temperature,
+                    max_tokens=self.config.nail_max_tokens,
+                    api_key=rag_flow.access_token
+                )
+                
+                self._has_nail_llm = True
+                logger.info(f"✅ NailLLMLangchain initialized successfully with model: {self.config.nail_model_id}")
+                
+            except Exception as e:
+                logger.error(f"Failed to initialize NailLLMLangchain: {e}")
+                raise
+        else:
             logger.warning("NailLLMLangchain not available, falling back to GeminiLLMWrapper")
             try:
                 from gemini_llm_wrapper import GeminiLLMWrapper
@@ -56,15 +96,40 @@ class LLMIntegration:
             except Exception as e:
                 logger.error(f"Failed to initialize GeminiLLMWrapper: {e}")
                 raise
-        except Exception as e:
-            logger.error(f"Failed to initialize NailLLMLangchain: {e}")
-            raise
+    
+    @staticmethod
+    def _prompt_key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
     
     def invoke(self, prompt: str) -> str:
         """Invoke the LLM with a prompt"""
         if self.llm_instance is None:
             raise RuntimeError("LLM is not initialized")
-        return self.llm_instance.invoke(prompt)
+        key = self._prompt_key(prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+        response = self.llm_instance.invoke(prompt)
+        if response:
+            self._response_cache[key] = response
+        return response
+    
+    async def ainvoke(self, prompt: str) -> str:
+        """Invoke the LLM without blocking the event loop"""
+        if self.llm_instance is None:
+            raise RuntimeError("LLM is not initialized")
+        key = self._prompt_key(prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+        async with self._semaphore:
+            if hasattr(self.llm_instance, "ainvoke"):
+                response = await self.llm_instance.ainvoke(prompt)
+            else:
+                response = await asyncio.to_thread(self.llm_instance.invoke, prompt)
+        if response:
+            self._response_cache[key] = response
+        return response
     
     @property
     def is_initialized(self) -> bool:
@@ -4,10 +4,13 @@ MCP Client module
 This module contains the MCPClient class for handling MCP operations.
 """
 
+import asyncio
 import json
 import logging
+import re
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
+from cachetools import TTLCache
 from fastapi import HTTPException
 from fastmcp import Client
 from fastmcp.client.transports import StreamableHttpTransport
@@ -17,6 +20,17 @@ from .llm_integration import LLMIntegration
 
 logger = logging.getLogger(__name__)
 
+# Matches an optional ```/```sql markdown fence around the generated SQL
+_SQL_FENCE_RE = re.compile(r"^\s*```(?:sql)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL | re.IGNORECASE)
+
+# Single read-only statements (same rule as the server's query cache)
+_READ_ONLY_QUERY_RE = re.compile(r"^\s*(select|show|describe|desc|explain)\b", re.IGNORECASE)
+
+
+def _is_read_only_query(query: str) -> bool:
+    """True for a single read-only statement"""
+    return bool(_READ_ONLY_QUERY_RE.match(query)) and ";" not in query.strip().rstrip(";")
+
 
 class MCPClient:
     """MCP Client class to handle all MCP operations and LLM interactions"""
@@ -26,7 +40,14 @@ class MCPClient:
         self.mcp_client_instance: Optional[Client] = None
         self.mcp_tools_cache: Optional[Dict[str, Any]] = None
         self.mcp_schema_cache: Optional[str] = None
-        self.llm_integration = LLMIntegration(config)
+        self.ask_llm_cache = TTLCache(maxsize=256, ttl=config.ask_llm_cache_ttl)
+        # Bumped by every write so answers computed before it aren't cached
+        self._ask_llm_cache_epoch = 0
+        self.llm_integration = LLMIntegration.shared(config)
+        
+        # Single-flight guards so concurrent first requests initialize once
+        self._client_lock = asyncio.Lock()
+        self._schema_lock = asyncio.Lock()
         
     async def startup(self):
         """Initialize MCP client and LLM instance"""
@@ -58,8 +79,9 @@ class MCPClient:
         try:
             server_url = self.config.normalize_server_url(self.config.mcp_server_url)
             transport = StreamableHttpTransport(url=server_url)
-            self.mcp_client_instance = Client(transport)
-            await self.mcp_client_instance.__aenter__()
+            client = Client(transport)
+            await client.__aenter__()
+            self.mcp_client_instance = client
             logger.info(f"Created persistent MCP client connection to {server_url}")
         except Exception as e:
             logger.error(f"Failed to initialize MCP client: {e}")
@@ -69,40 +91,42 @@ class MCPClient:
     async def get_mcp_client(self) -> Client:
         """Get MCP client instance"""
         if self.mcp_client_instance is None:
-            await self._initialize_mcp_client()
+            async with self._client_lock:
+                if self.mcp_client_instance is None:
+                    await self._initialize_mcp_client()
         return self.mcp_client_instance
     
     async def call_mcp_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
-        """Call MCP tool on the server using persistent FastMCP client"""
+        """
+        Call MCP tool on the server using persistent FastMCP client
+        
+        Returns:
+            {"data": <parsed content>} for JSON results, {"raw": <text>} otherwise
+        """
         try:
             client = await self.get_mcp_client()
             result = await client.call_tool(tool_name, kwargs)
             
             logger.debug(f"MCP tool {tool_name} raw result: {result}")
-            logger.debug(f"Result type: {type(result)}")
-            
-            # Extract common result shapes
-            if hasattr(result, 'content') and result.content:
-                text = result.content[0].text
-                logger.debug(f"MCP tool {tool_name} content text: {text}")
-                try:
-                    # Handle MCP-compliant response format
-                    parsed = json.loads(text)
-                    logger.debug(f"MCP tool {tool_name} parsed: {parsed}")
-                    logger.debug(f"Parsed type: {type(parsed)}")
-                    
-                    if isinstance(parsed, dict) and 'result' in parsed:
-                        return parsed['result'].get('content', parsed['result'])
-                    elif isinstance(parsed, dict) and 'error' in parsed:
-                        raise Exception(f"MCP Error: {parsed['error'].get('message', 'Unknown error')}")
-                    else:
-                        return parsed
-                except json.JSONDecodeError:
-                    logger.debug(f"MCP tool {tool_name} JSON decode failed, returning as text")
-                    return {"content": text}
-            else:
+            
+            if not (hasattr(result, 'content') and result.content):
                 logger.debug(f"MCP tool {tool_name} no content, returning string result")
-                return {"content": str(result)}
+                return {"raw": str(result)}
+            
+            text = result.content[0].text
+            try:
+                parsed = json.loads(text)
+            except json.JSONDecodeError:
+                logger.debug(f"MCP tool {tool_name} JSON decode failed, returning as text")
+                return {"raw": text}
+            
+            # Unwrap MCP-compliant response envelopes
+            if isinstance(parsed, dict):
+                if 'result' in parsed:
+                    return {"data": parsed['result'].get('content', parsed['result'])}
+                if 'error' in parsed:
+                    raise Exception(f"MCP Error: {parsed['error'].get('message', 'Unknown error')}")
+            return {"data": parsed}
                 
         except Exception as e:
             logger.error(f"Error calling MCP tool {tool_name}: {e}")
@@ -123,6 +147,14 @@ class MCPClient:
             logger.error(f"Error getting MCP resource {uri}: {e}")
             raise
     
+    async def get_database_schema(self) -> str:
+        """Get the database schema resource, fetching it only once"""
+        if self.mcp_schema_cache is None:
+            async with self._schema_lock:
+                if self.mcp_schema_cache is None:
+                    self.mcp_schema_cache = await self.get_mcp_resource("database://schema")
+        return self.mcp_schema_cache
+    
     async def discover_mcp_tools(self) -> Dict[str, Any]:
         """Discover available MCP tools from the server"""
         try:
@@ -149,6 +181,15 @@ class MCPClient:
         """Process natural language question using LLM and MCP tools"""
         start_time = datetime.now(timezone.utc)
         
+        # Serve repeated questions from cache (execution_time is always fresh)
+        cache_key = (question, max_results)
+        cached = self.ask_llm_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Returning cached answer for question '{question}'")
+            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            return {**cached, "execution_time": execution_time}
+        
+        epoch = self._ask_llm_cache_epoch
         try:
             # Debug logging
             logger.info(f"LLM instance status: {self.llm_integration.is_initialized}")
@@ -159,13 +200,12 @@ class MCPClient:
                 raise HTTPException(status_code=500, detail="LLM is not configured")
             
             # Get database schema
-            if self.mcp_schema_cache is None:
-                self.mcp_schema_cache = await self.get_mcp_resource("database://schema")
+            schema = await self.get_database_schema()
             
             # Create prompt for LLM
             prompt = f"""
             Database Schema:
-            {self.mcp_schema_cache}
+            {schema}
             
             Question: {question}
             
@@ -173,31 +213,37 @@ class MCPClient:
             """
             
             # Get SQL query from LLM
-            sql_query = self.llm_integration.invoke(prompt).strip()
+            sql_query = await self.llm_integration.ainvoke(prompt)
             
             # Clean up SQL query (remove markdown formatting if present)
-            if sql_query.startswith("```sql"):
-                sql_query = sql_query.replace("```sql", "").replace("```", "").strip()
-            elif sql_query.startswith("```"):
-                sql_query = sql_query.replace("```", "").strip()
+            fence_match = _SQL_FENCE_RE.match(sql_query)
+            sql_query = fence_match.group(1) if fence_match else sql_query.strip()
             
-            # Execute SQL query using MCP tool
-            result = await self.call_mcp_tool("query_database", query=sql_query, limit=max_results)
+            # Execute SQL query using MCP tool; a write makes every cached answer stale
+            read_only = _is_read_only_query(sql_query)
+            try:
+                result = await self.call_mcp_tool("query_database", query=sql_query, limit=max_results)
+            finally:
+                if not read_only:
+                    self._ask_llm_cache_epoch += 1
+                    self.ask_llm_cache.clear()
             
             execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             
             # Handle different result formats
-            if isinstance(result, dict):
-                data = result.get("data", [])
-                row_count = result.get("row_count", len(data) if isinstance(data, list) else 0)
-            elif isinstance(result, list):
-                data = result
-                row_count = len(result)
-            else:
-                data = [{"result": str(result)}]
+            if "raw" in result:
+                data = [{"result": result["raw"]}]
                 row_count = 1
+            else:
+                content = result["data"]
+                if isinstance(content, dict):
+                    data = content.get("data", [])
+                    row_count = content.get("row_count", len(data))
+                else:
+                    data = content
+                    row_count = len(content)
             
-            return {
+            response = {
                 "success": True,
                 "question": question,
                 "sql_query": sql_query,
@@ -207,6 +253,12 @@ class MCPClient:
                 "error": None
             }
             
+            # Only successful read-only answers are cached, and only if no write
+            # ran while this one was in flight
+            if read_only and epoch == self._ask_llm_cache_epoch:
+                self.ask_llm_cache[cache_key] = response
+            return response
+            
         except Exception as e:
             execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             logger.error(f"Error processing question '{question}': {e}")
@@ -107,6 +107,34 @@ class GeminiLLMWrapper:
             logger.error(f"Error invoking Gemini model: {e}")
             raise
     
+    async def ainvoke(self, prompt: str, **kwargs) -> str:
+        """
+        Invoke the Gemini model asynchronously with a prompt.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional arguments (ignored for compatibility)
+            
+        Returns:
+            Generated response as string
+        """
+        try:
+            # The SDK's async client keeps the event loop free during the request
+            response = await self.client.aio.models.generate_content(
+                model=self.model_id,
+                contents=prompt
+            )
+            
+            if response.text:
+                return response.text
+            else:
+                logger.warning("Gemini returned empty response")
+                return ""
+                
+        except Exception as e:
+            logger.error(f"Error invoking Gemini model: {e}")
+            raise
+    
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Alternative method name for compatibility.
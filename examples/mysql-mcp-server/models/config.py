@@ -21,6 +21,12 @@ class MCPClientConfig:
         self.nail_temperature = float(os.getenv("NAIL_TEMPERATURE", "0.1"))
         self.nail_max_tokens = int(os.getenv("NAIL_MAX_TOKENS", "300"))
         
+        # Cache configuration
+        self.ask_llm_cache_ttl = int(os.getenv("ASK_LLM_CACHE_TTL", "60"))
+        
+        # LLM configuration
+        self.llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        
         # Debug: Print loaded configuration
         self._print_config()
     
@@ -35,6 +41,8 @@ class MCPClientConfig:
         print(f"   NAIL_MODEL_ID: {self.nail_model_id}")
         print(f"   NAIL_TEMPERATURE: {self.nail_temperature}")
         print(f"   NAIL_MAX_TOKENS: {self.nail_max_tokens}")
+        print(f"   ASK_LLM_CACHE_TTL: {self.ask_llm_cache_ttl}")
+        print(f"   LLM_MAX_CONCURRENCY: {self.llm_max_concurrency}")
     
     def normalize_server_url(self, url: str) -> str:
         """Normalize MCP server URL"""
@@ -54,6 +62,12 @@ class DatabaseConfig:
         self.db_name = os.getenv("DB_NAME", "test_db")
         self.db_path = os.getenv("DB_PATH", "")
         
+        # Connection pool configuration
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+        
         # Server configuration
         self.server_host = os.getenv("SERVER_HOST", "127.0.0.1")
         self.server_port = int(os.getenv("SERVER_PORT", "8000"))
@@ -75,10 +89,27 @@ class DatabaseConfig:
         print(f"   DB_PORT: {self.db_port}")
         print(f"   DB_USER: {self.db_user}")
         print(f"   DB_NAME: {self.db_name}")
+        print(f"   DB_POOL_SIZE: {self.db_pool_size}")
+        print(f"   DB_MAX_OVERFLOW: {self.db_max_overflow}")
+        print(f"   DB_POOL_TIMEOUT: {self.db_pool_timeout}")
+        print(f"   DB_POOL_RECYCLE: {self.db_pool_recycle}")
         print(f"   SERVER_HOST: {self.server_host}")
         print(f"   SERVER_PORT: {self.server_port}")
         print(f"   LOG_LEVEL: {self.log_level}")
     
+    def get_engine_options(self) -> dict:
+        """Get SQLAlchemy engine options for the configured database type"""
+        options = {"echo": False, "pool_pre_ping": True}
+        if self.db_type != "sqlite":
+            # SQLite uses a file/singleton pool that takes no sizing options
+            options.update(
+                pool_size=self.db_pool_size,
+                max_overflow=self.db_max_overflow,
+                pool_timeout=self.db_pool_timeout,
+                pool_recycle=self.db_pool_recycle
+            )
+        return options
+    
     def get_connection_string(self) -> str:
         """Get database connection string based on type"""
         if self.db_type == "mysql":
@@ -5,6 +5,7 @@ This module handles database connections and operations.
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 from datetime import datetime, date, time
@@ -17,6 +18,31 @@ from models.config import DatabaseConfig
 
 logger = logging.getLogger(__name__)
 
+# Column types that need converting before JSON serialization
+_CONVERTIBLE_TYPES = (Decimal, datetime, date, time)
+
+
+def _to_json_value(val: Any) -> Any:
+    """Convert a single database value to a JSON-serializable value"""
+    if isinstance(val, Decimal):
+        return float(val)
+    if isinstance(val, (datetime, date, time)):
+        return val.isoformat()
+    return val
+
+
+def _columns_needing_conversion(rows: List[Any], column_count: int) -> List[int]:
+    """Return indexes of columns whose first non-NULL value needs conversion"""
+    convert_idx = []
+    for idx in range(column_count):
+        for row in rows:
+            val = row[idx]
+            if val is not None:
+                if isinstance(val, _CONVERTIBLE_TYPES):
+                    convert_idx.append(idx)
+                break
+    return convert_idx
+
 
 class DatabaseOperations:
     """Handles database connections and operations"""
@@ -25,23 +51,34 @@ class DatabaseOperations:
         self.config = config
         self.engine: Optional[Engine] = None
         self.connection = None
+        self._connect_lock = threading.Lock()
     
     def connect(self) -> None:
         """Establish database connection"""
         try:
             connection_string = self.config.get_connection_string()
-            self.engine = create_engine(connection_string, echo=False)
+            self.engine = create_engine(connection_string, **self.config.get_engine_options())
             
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             
-            logger.info(f"Connected to {self.config.db_type} database: {self.config.db_name}")
+            logger.info("Connected to %s database: %s", self.config.db_type, self.config.db_name)
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to connect to database: {e}")
+            logger.error("Failed to connect to database: %s", e)
             raise
     
+    def get_engine(self) -> Engine:
+        """Return the engine, connecting on first use (safe across worker threads)"""
+        engine = self.engine
+        if engine is None:
+            with self._connect_lock:
+                if self.engine is None:
+                    self.connect()
+                engine = self.engine
+        return engine
+    
     def disconnect(self) -> None:
         """Close database connection"""
         if self.engine:
@@ -51,11 +88,8 @@ class DatabaseOperations:
     
     def execute_query(self, query: str, limit: int = 1000) -> Dict[str, Any]:
         """Execute a SQL query and return results"""
-        if not self.engine:
-            raise RuntimeError("Database not connected")
-        
         try:
-            with self.engine.connect() as conn:
+            with self.get_engine().connect() as conn:
                 # Split query into individual statements if it contains semicolons
                 if ';' in query:
                     statements = self._split_sql_statements(query)
@@ -70,12 +104,13 @@ class DatabaseOperations:
                     if not statement:
                         continue
                     
-                    logger.info(f"Executing statement {i+1}: {statement[:100]}...")
+                    logger.info("Executing statement %d: %.100s...", i+1, statement)
                     
                     # Add LIMIT clause only for SELECT statements, not for SHOW/DESCRIBE
+                    statement_upper = statement.upper()
                     if (limit and limit > 0 and 
-                        "LIMIT" not in statement.upper() and 
-                        statement.upper().strip().startswith("SELECT")):
+                        statement_upper.lstrip().startswith("SELECT") and 
+                        "LIMIT" not in statement_upper):
                         statement = f"{statement.rstrip(';')} LIMIT {limit}"
                     
                     executed_queries.append(statement)
@@ -90,30 +125,27 @@ class DatabaseOperations:
                         # Fetch all rows
                         rows = result.fetchall()
                         
-                        logger.info(f"Statement {i+1} returned {len(rows)} rows with columns: {columns}")
+                        logger.info("Statement %d returned %d rows with columns: %s", i+1, len(rows), columns)
                         
-                        # Convert to list of dictionaries and handle serialization
-                        statement_data = []
-                        for row in rows:
-                            row_dict = {}
-                            for col, val in zip(columns, row):
-                                # Convert various types for JSON serialization
-                                if isinstance(val, Decimal):
-                                    row_dict[col] = float(val)
-                                elif isinstance(val, (datetime, date)):
-                                    row_dict[col] = val.isoformat()
-                                elif isinstance(val, time):
-                                    row_dict[col] = val.isoformat()
-                                else:
-                                    row_dict[col] = val
-                            statement_data.append(row_dict)
+                        # Convert to list of dictionaries, only touching the
+                        # columns that actually hold non-JSON types
+                        convert_idx = _columns_needing_conversion(rows, len(columns))
+                        if convert_idx:
+                            statement_data = []
+                            for row in rows:
+                                values = list(row)
+                                for idx in convert_idx:
+                                    values[idx] = _to_json_value(values[idx])
+                                statement_data.append(dict(zip(columns, values)))
+                        else:
+                            statement_data = [dict(zip(columns, row)) for row in rows]
                         all_data.extend(statement_data)
                         
-                        logger.info(f"Statement {i+1} data: {statement_data[:2] if statement_data else 'No data'}")
+                        logger.info("Statement %d data: %s", i+1, statement_data[:2] if statement_data else 'No data')
                         
                     except SQLAlchemyError as e:
-                        logger.error(f"Statement {i+1} execution failed: {e}")
-                        logger.error(f"Failed statement: {statement}")
+                        logger.error("Statement %d execution failed: %s", i+1, e)
+                        logger.error("Failed statement: %s", statement)
                         # Continue with other statements
                         continue
                 
@@ -125,7 +157,7 @@ class DatabaseOperations:
                 }
                 
         except SQLAlchemyError as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             raise
     
     def _split_sql_statements(self, query: str) -> List[str]:
@@ -172,12 +204,9 @@ class DatabaseOperations:
     
     def get_schema_info(self) -> Dict[str, Any]:
         """Get database schema information"""
-        if not self.engine:
-            raise RuntimeError("Database not connected")
-        
         try:
             metadata = MetaData()
-            metadata.reflect(bind=self.engine)
+            metadata.reflect(bind=self.get_engine())
             
             schema_info = {
                 "tables": {},
@@ -203,16 +232,13 @@ class DatabaseOperations:
             return schema_info
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to get schema info: {e}")
+            logger.error("Failed to get schema info: %s", e)
             raise
     
     def health_check(self) -> Dict[str, Any]:
         """Perform database health check"""
-        if not self.engine:
-            return {"status": "disconnected", "error": "No database connection"}
-        
         try:
-            with self.engine.connect() as conn:
+            with self.get_engine().connect() as conn:
                 result = conn.execute(text("SELECT 1 as health_check"))
                 row = result.fetchone()
                 
@@ -6,8 +6,10 @@ This module handles database schema caching and management.
 
 import json
 import logging
+import re
+import threading
+import time
 from typing import Dict, Any, Optional
-from cachetools import TTLCache
 from datetime import datetime, timezone
 
 from models.config import DatabaseConfig
@@ -15,6 +17,9 @@ from .database_operations import DatabaseOperations
 
 logger = logging.getLogger(__name__)
 
+# Statements that can change the schema, at the start of any statement in a batch
+_DDL_RE = re.compile(r"(?:^|;)\s*(create|alter|drop|rename|truncate)\b", re.IGNORECASE)
+
 
 class SchemaManager:
     """Manages database schema caching and retrieval"""
@@ -22,15 +27,25 @@ class SchemaManager:
     def __init__(self, config: DatabaseConfig, db_ops: DatabaseOperations):
         self.config = config
         self.db_ops = db_ops
-        self.cache = TTLCache(maxsize=1000, ttl=config.schema_cache_ttl)
-        self._schema_cache_key = "database_schema"
+        # Single cached schema plus its monotonic expiry time
+        self._schema: Optional[str] = None
+        self._schema_expiry = 0.0
+        # Serializes cache misses so concurrent callers reflect the schema once
+        self._refresh_lock = threading.Lock()
     
     def get_schema(self, force_refresh: bool = False) -> str:
         """Get database schema, using cache if available"""
-        if not force_refresh and self._schema_cache_key in self.cache:
+        if not force_refresh and self._schema is not None and time.monotonic() < self._schema_expiry:
             logger.debug("Returning cached schema")
-            return self.cache[self._schema_cache_key]
+            return self._schema
         
+        with self._refresh_lock:
+            if not force_refresh and self._schema is not None and time.monotonic() < self._schema_expiry:
+                return self._schema
+            return self._load_schema()
+    
+    def _load_schema(self) -> str:
+        """Reflect the schema from the database and cache the formatted text"""
         try:
             logger.info("Fetching fresh database schema")
             schema_info = self.db_ops.get_schema_info()
@@ -39,20 +54,29 @@ class SchemaManager:
             schema_text = self._format_schema(schema_info)
             
             # Cache the result
-            self.cache[self._schema_cache_key] = schema_text
+            self._schema = schema_text
+            ttl = self.config.schema_cache_ttl
+            self._schema_expiry = time.monotonic() + ttl if ttl > 0 else float("inf")
             
-            logger.info(f"Schema cached successfully ({len(schema_text)} characters)")
+            logger.info("Schema cached successfully (%d characters)", len(schema_text))
             return schema_text
             
         except Exception as e:
-            logger.error(f"Failed to get schema: {e}")
+            logger.error("Failed to get schema: %s", e)
             # Return cached version if available, otherwise return error message
-            if self._schema_cache_key in self.cache:
+            if self._schema is not None:
                 logger.warning("Returning stale cached schema due to error")
-                return self.cache[self._schema_cache_key]
+                return self._schema
             else:
                 return f"Error retrieving database schema: {str(e)}"
     
+    def invalidate_on_ddl(self, query: str) -> bool:
+        """Clear the cached schema if the query contains DDL; returns True if it did"""
+        if _DDL_RE.search(query):
+            self.clear_cache()
+            return True
+        return False
+    
     def refresh_schema(self) -> str:
         """Force refresh the database schema"""
         logger.info("Force refreshing database schema")
@@ -60,27 +84,32 @@ class SchemaManager:
     
     def _format_schema(self, schema_info: Dict[str, Any]) -> str:
         """Format schema information as readable text"""
-        lines = []
-        lines.append(f"Database: {schema_info['database_name']} ({schema_info['database_type']})")
-        lines.append("=" * 50)
-        lines.append("")
+        # Indexed by the column's boolean flags instead of branching per column
+        nullable_labels = ("NOT NULL", "NULL")
+        pk_markers = ("", " (PK)")
+        
+        lines = [
+            f"Database: {schema_info['database_name']} ({schema_info['database_type']})",
+            "=" * 50,
+            ""
+        ]
+        add = lines.append
         
         for table_name, table_info in schema_info['tables'].items():
-            lines.append(f"Table: {table_name}")
-            lines.append("-" * 30)
+            add(f"Table: {table_name}")
+            add("-" * 30)
             
             # Primary keys
             if table_info['primary_keys']:
-                lines.append(f"Primary Keys: {', '.join(table_info['primary_keys'])}")
+                add(f"Primary Keys: {', '.join(table_info['primary_keys'])}")
             
             # Columns
-            lines.append("Columns:")
+            add("Columns:")
             for column in table_info['columns']:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                pk_marker = " (PK)" if column['primary_key'] else ""
-                lines.append(f"  - {column['name']}: {column['type']} {nullable}{pk_marker}")
+                add(f"  - {column['name']}: {column['type']} "
+                    f"{nullable_labels[bool(column['nullable'])]}{pk_markers[bool(column['primary_key'])]}")
             
-            lines.append("")
+            add("")
         
         return "\n".join(lines)
     
@@ -94,7 +123,7 @@ class SchemaManager:
                 "cache_ttl": self.config.schema_cache_ttl
             }
         except Exception as e:
-            logger.error(f"Failed to get schema JSON: {e}")
+            logger.error("Failed to get schema JSON: %s", e)
             return {
                 "error": str(e),
                 "cached_at": datetime.now(timezone.utc).isoformat()
@@ -102,5 +131,6 @@ class SchemaManager:
     
     def clear_cache(self) -> None:
         """Clear the schema cache"""
-        self.cache.clear()
+        self._schema = None
+        self._schema_expiry = 0.0
         logger.info("Schema cache cleared")
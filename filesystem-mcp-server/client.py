@@ -13,6 +13,7 @@ Usage:
 
 import asyncio
 import logging
+import sys
 import uvicorn
 
 # Load environment variables
@@ -41,7 +42,13 @@ async def main():
         logger.info(f"Starting FastAPI server on {config.client_host}:{config.client_port}")
         
         # Use uvicorn.run with proper configuration
-        uvicorn_config = uvicorn.Config(app, host=config.client_host, port=config.client_port, log_level="info")
+        uvicorn_config = uvicorn.Config(
+            app,
+            host=config.client_host,
+            port=config.client_port,
+            log_level="info",
+            http="httptools"
+        )
         server = uvicorn.Server(uvicorn_config)
         await server.serve()
     except KeyboardInterrupt:
@@ -52,4 +59,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is not available on Windows
+    if sys.platform == "win32":
+        asyncio.run(main())
+    else:
+        import uvloop
+        uvloop.run(main())
@@ -9,10 +9,11 @@ from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from models.config import MCPClientConfig
 from models.requests import AskLLMRequest
-from models.responses import AskLLMResponse, HealthResponse
+from models.responses import AskLLMResponse, HealthResponse, HealthResponseDict
 from .mcp_client import MCPClient
 
 logger = logging.getLogger(__name__)
@@ -33,17 +34,19 @@ class FastAPIClient:
             description="Minimal FastAPI client for natural language database queries",
             version="1.0.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            default_response_class=ORJSONResponse
         )
         
-        # CORS middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+        # CORS middleware; skipped entirely when CORS_ORIGINS is empty
+        if self.config.cors_origins:
+            app.add_middleware(
+                CORSMiddleware,
+                allow_origins=self.config.cors_origins,
+                allow_credentials="*" not in self.config.cors_origins,
+                allow_methods=["*"],
+                allow_headers=["*"],
+            )
         
         # Add lifespan context manager
         @asynccontextmanager
@@ -64,6 +67,16 @@ class FastAPIClient:
     def _add_routes(self, app: FastAPI):
         """Add all API routes to the FastAPI app"""
         
+        # Handlers already return well-formed dicts, so response models are
+        # only enforced when VALIDATE_API_RESPONSE is enabled
+        validate = self.config.validate_api_response
+        ask_llm_model = AskLLMResponse if validate else None
+        health_model = HealthResponse if validate else None
+        
+        # Returning a prebuilt ORJSONResponse skips FastAPI's jsonable_encoder
+        # walk; validated responses still go through the normal path
+        respond = (lambda content: content) if validate else ORJSONResponse
+        
         @app.get("/")
         async def root():
             """Root endpoint with API information"""
@@ -78,38 +91,40 @@ class FastAPIClient:
                 }
             }
         
-        @app.post("/ask_llm", response_model=AskLLMResponse)
+        @app.post("/ask_llm", response_model=ask_llm_model)
         async def ask_llm(request: AskLLMRequest):
             """Process natural language database query using LLM and MCP tools"""
-            return await self.mcp_client.ask_llm(request.question, request.max_results)
+            return respond(await self.mcp_client.ask_llm(request.question, request.max_results))
         
-        @app.get("/health", response_model=HealthResponse)
+        @app.get("/health", response_model=health_model)
         async def health_check():
             """Client health check endpoint"""
-            return HealthResponse(
-                status="healthy",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                error=None
-            )
+            content: HealthResponseDict = {
+                "status": "healthy",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "error": None
+            }
+            return respond(content)
         
-        @app.get("/mcp/health", response_model=HealthResponse)
+        @app.get("/mcp/health", response_model=health_model)
         async def mcp_health_check():
             """MCP server connection health check"""
             try:
                 # Try to get MCP server info
                 result = await self.mcp_client.call_mcp_tool("health_check")
-                return HealthResponse(
-                    status="healthy",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    error=None
-                )
+                content: HealthResponseDict = {
+                    "status": "healthy",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "error": None
+                }
             except Exception as e:
-                logger.warning(f"MCP server health check failed: {e}")
-                return HealthResponse(
-                    status="unhealthy",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    error=f"MCP server not available: {str(e)}"
-                )
+                logger.warning("MCP server health check failed: %s", e)
+                content = {
+                    "status": "unhealthy",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "error": f"MCP server not available: {str(e)}"
+                }
+            return respond(content)
         
         @app.get("/mcp/capabilities")
         async def mcp_capabilities():
@@ -132,18 +147,18 @@ class FastAPIClient:
                 except:
                     prompts_info = {"prompts://database": "Not available"}
                 
-                return {
+                return ORJSONResponse({
                     "tools": tools,
                     "resources": resources,
                     "prompts": prompts_info,
                     "tool_count": len(tools),
                     "resource_count": len(resources),
                     "prompt_count": len(prompts_info)
-                }
+                })
                 
             except Exception as e:
-                logger.error(f"Error getting MCP capabilities: {e}")
-                return {
+                logger.error("Error getting MCP capabilities: %s", e)
+                return ORJSONResponse({
                     "error": str(e),
                     "tools": {},
                     "resources": {},
@@ -151,4 +166,4 @@ class FastAPIClient:
                     "tool_count": 0,
                     "resource_count": 0,
                     "prompt_count": 0
-                }
+                })
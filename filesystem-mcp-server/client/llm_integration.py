@@ -4,6 +4,7 @@ LLM Integration module
 This module handles LLM initialization and integration logic.
 """
 
+import asyncio
 import logging
 from typing import Optional, Any
 from models.config import MCPClientConfig
@@ -66,6 +67,27 @@ class LLMIntegration:
             raise RuntimeError("LLM is not initialized")
         return self.llm_instance.invoke(prompt)
     
+    async def ainvoke(self, prompt: str) -> str:
+        """Invoke the LLM without blocking the event loop"""
+        if self.llm_instance is None:
+            raise RuntimeError("LLM is not initialized")
+        if hasattr(self.llm_instance, "ainvoke"):
+            return await self.llm_instance.ainvoke(prompt)
+        return await asyncio.to_thread(self.llm_instance.invoke, prompt)
+    
+    async def warm_up(self, timeout: float = 2.0) -> None:
+        """Send one throwaway prompt so the first real request skips client/auth setup
+
+        The prompt is a billable completion, so this only runs when LLM_WARMUP is set.
+        """
+        if self.llm_instance is None:
+            return
+        try:
+            await asyncio.wait_for(self.ainvoke("ping"), timeout)
+            logger.info("LLM warm-up completed")
+        except Exception as e:
+            logger.warning(f"LLM warm-up failed: {e!r}")
+    
     @property
     def is_initialized(self) -> bool:
         """Check if LLM is initialized"""
@@ -4,19 +4,36 @@ MCP Client module
 This module contains the MCPClient class for handling MCP operations.
 """
 
-import json
+import asyncio
 import logging
+import re
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+import orjson
 from fastapi import HTTPException
 from fastmcp import Client
 from fastmcp.client.transports import StreamableHttpTransport
 
 from models.config import MCPClientConfig
+from models.responses import AskLLMResponseDict
+from utils.async_cache import AsyncTTLCache
 from .llm_integration import LLMIntegration
 
 logger = logging.getLogger(__name__)
 
+# Matches an optional ```/```sql markdown fence around the generated SQL
+_SQL_FENCE_RE = re.compile(r"^\s*```(?:sql)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL | re.IGNORECASE)
+
+# Prompt sent to the LLM; the schema and question are filled in per request
+_QUERY_PROMPT_TEMPLATE = """
+Database Schema:
+{schema}
+
+Question: {question}
+
+Please generate a SQL query to answer this question. Return only the SQL query, no explanations.
+"""
+
 
 class MCPClient:
     """MCP Client class to handle all MCP operations and LLM interactions"""
@@ -24,10 +41,19 @@ class MCPClient:
     def __init__(self, config: MCPClientConfig):
         self.config = config
         self.mcp_client_instance: Optional[Client] = None
-        self.mcp_tools_cache: Optional[Dict[str, Any]] = None
-        self.mcp_schema_cache: Optional[str] = None
+        self.mcp_tools_cache = AsyncTTLCache(config.mcp_metadata_ttl)
+        self.mcp_schema_cache = AsyncTTLCache(config.mcp_metadata_ttl)
         self.llm_integration = LLMIntegration(config)
         
+        # Guards the one-time connection and bounds in-flight MCP requests
+        self._client_lock = asyncio.Lock()
+        self._mcp_semaphore = asyncio.Semaphore(config.mcp_max_concurrency)
+        
+        # Normalized once; failed connects back off exponentially (1s -> 16s)
+        self._server_url = config.normalize_server_url(config.mcp_server_url)
+        self._reconnect_delay = 0.0
+        self._next_connect_at = 0.0
+        
     async def startup(self):
         """Initialize MCP client and LLM instance"""
         try:
@@ -35,9 +61,18 @@ class MCPClient:
             
             # Initialize LLM
             await self.llm_integration.initialize()
+            if self.config.llm_warmup:
+                await self.llm_integration.warm_up()
+            
+            # Open the shared MCP connection and prefetch the schema used by every
+            # prompt; fall back to doing both on first use
+            try:
+                await self.get_mcp_client()
+                await self.get_database_schema()
+            except Exception:
+                logger.warning("MCP connection will be retried on first use")
             
-            # Don't initialize MCP client during startup - do it lazily when needed
-            logger.info("MCP Client startup completed successfully (MCP connection will be established on first use)")
+            logger.info("MCP Client startup completed successfully")
             
         except Exception as e:
             logger.error(f"Failed to start MCP Client: {e}")
@@ -55,13 +90,23 @@ class MCPClient:
     
     async def _initialize_mcp_client(self):
         """Initialize MCP client connection"""
+        now = time.monotonic()
+        if now < self._next_connect_at:
+            raise HTTPException(
+                status_code=503,
+                detail=f"MCP server unavailable, retrying in {self._next_connect_at - now:.1f}s"
+            )
+        
         try:
-            server_url = self.config.normalize_server_url(self.config.mcp_server_url)
-            transport = StreamableHttpTransport(url=server_url)
-            self.mcp_client_instance = Client(transport)
-            await self.mcp_client_instance.__aenter__()
-            logger.info(f"Created persistent MCP client connection to {server_url}")
+            transport = StreamableHttpTransport(url=self._server_url)
+            client = Client(transport)
+            await client.__aenter__()
+            self.mcp_client_instance = client
+            self._reconnect_delay = 0.0
+            logger.info(f"Created persistent MCP client connection to {self._server_url}")
         except Exception as e:
+            self._reconnect_delay = min(max(self._reconnect_delay * 2, 1.0), 16.0)
+            self._next_connect_at = time.monotonic() + self._reconnect_delay
             logger.error(f"Failed to initialize MCP client: {e}")
             logger.warning("MCP server may not be running. Some features will be unavailable.")
             raise
@@ -69,27 +114,36 @@ class MCPClient:
     async def get_mcp_client(self) -> Client:
         """Get MCP client instance"""
         if self.mcp_client_instance is None:
-            await self._initialize_mcp_client()
+            async with self._client_lock:
+                if self.mcp_client_instance is None:
+                    await self._initialize_mcp_client()
         return self.mcp_client_instance
     
     async def call_mcp_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Call MCP tool on the server using persistent FastMCP client"""
         try:
             client = await self.get_mcp_client()
-            result = await client.call_tool(tool_name, kwargs)
+            async with self._mcp_semaphore:
+                result = await client.call_tool(tool_name, kwargs)
             
-            logger.debug(f"MCP tool {tool_name} raw result: {result}")
-            logger.debug(f"Result type: {type(result)}")
+            # Formatting whole tool results is expensive, so only do it when
+            # debug logging is actually on
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"MCP tool {tool_name} raw result: {result}")
+                logger.debug(f"Result type: {type(result)}")
             
             # Extract common result shapes
             if hasattr(result, 'content') and result.content:
                 text = result.content[0].text
-                logger.debug(f"MCP tool {tool_name} content text: {text}")
+                if debug:
+                    logger.debug(f"MCP tool {tool_name} content text: {text}")
                 try:
                     # Handle MCP-compliant response format
-                    parsed = json.loads(text)
-                    logger.debug(f"MCP tool {tool_name} parsed: {parsed}")
-                    logger.debug(f"Parsed type: {type(parsed)}")
+                    parsed = orjson.loads(text)
+                    if debug:
+                        logger.debug(f"MCP tool {tool_name} parsed: {parsed}")
+                        logger.debug(f"Parsed type: {type(parsed)}")
                     
                     if isinstance(parsed, dict) and 'result' in parsed:
                         return parsed['result'].get('content', parsed['result'])
@@ -97,22 +151,23 @@ class MCPClient:
                         raise Exception(f"MCP Error: {parsed['error'].get('message', 'Unknown error')}")
                     else:
                         return parsed
-                except json.JSONDecodeError:
-                    logger.debug(f"MCP tool {tool_name} JSON decode failed, returning as text")
+                except orjson.JSONDecodeError:
+                    logger.debug("MCP tool %s JSON decode failed, returning as text", tool_name)
                     return {"content": text}
             else:
-                logger.debug(f"MCP tool {tool_name} no content, returning string result")
+                logger.debug("MCP tool %s no content, returning string result", tool_name)
                 return {"content": str(result)}
                 
         except Exception as e:
-            logger.error(f"Error calling MCP tool {tool_name}: {e}")
+            logger.error("Error calling MCP tool %s: %s", tool_name, e)
             raise
     
     async def get_mcp_resource(self, uri: str) -> str:
         """Get MCP resource from the server"""
         try:
             client = await self.get_mcp_client()
-            result = await client.read_resource(uri)
+            async with self._mcp_semaphore:
+                result = await client.read_resource(uri)
             
             if hasattr(result, 'contents') and result.contents:
                 return result.contents[0].text
@@ -120,82 +175,85 @@ class MCPClient:
                 return str(result)
                 
         except Exception as e:
-            logger.error(f"Error getting MCP resource {uri}: {e}")
+            logger.error("Error getting MCP resource %s: %s", uri, e)
             raise
     
+    async def get_database_schema(self) -> str:
+        """Get the database schema resource, cached for MCP_METADATA_TTL seconds"""
+        return await self.mcp_schema_cache.get(lambda: self.get_mcp_resource("database://schema"))
+    
+    async def _list_mcp_tools(self) -> Dict[str, Any]:
+        """Fetch the tool list from the server"""
+        client = await self.get_mcp_client()
+        async with self._mcp_semaphore:
+            result = await client.list_tools()
+        
+        if hasattr(result, 'tools'):
+            tools = {}
+            for tool in result.tools:
+                tools[tool.name] = {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema
+                }
+            return tools
+        else:
+            return {}
+    
     async def discover_mcp_tools(self) -> Dict[str, Any]:
-        """Discover available MCP tools from the server"""
+        """Discover available MCP tools from the server, cached for MCP_METADATA_TTL seconds"""
         try:
-            client = await self.get_mcp_client()
-            result = await client.list_tools()
-            
-            if hasattr(result, 'tools'):
-                tools = {}
-                for tool in result.tools:
-                    tools[tool.name] = {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "inputSchema": tool.inputSchema
-                    }
-                return tools
-            else:
-                return {}
-                
+            return await self.mcp_tools_cache.get(self._list_mcp_tools)
         except Exception as e:
-            logger.error(f"Error discovering MCP tools: {e}")
+            logger.error("Error discovering MCP tools: %s", e)
             return {}
     
-    async def ask_llm(self, question: str, max_results: int = 100) -> Dict[str, Any]:
+    async def ask_llm(self, question: str, max_results: int = 100) -> AskLLMResponseDict:
         """Process natural language question using LLM and MCP tools"""
-        start_time = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
         
         try:
             # Debug logging
-            logger.info(f"LLM instance status: {self.llm_integration.is_initialized}")
-            logger.info(f"HAS_NAIL_LLM: {self.llm_integration.has_nail_llm}")
-            logger.info(f"LLM instance type: {type(self.llm_integration.llm_instance)}")
+            logger.debug("LLM instance status: %s", self.llm_integration.is_initialized)
+            logger.debug("HAS_NAIL_LLM: %s", self.llm_integration.has_nail_llm)
+            logger.debug("LLM instance type: %s", type(self.llm_integration.llm_instance))
             
             if not self.llm_integration.is_initialized:
                 raise HTTPException(status_code=500, detail="LLM is not configured")
             
             # Get database schema
-            if self.mcp_schema_cache is None:
-                self.mcp_schema_cache = await self.get_mcp_resource("database://schema")
+            schema = await self.get_database_schema()
             
             # Create prompt for LLM
-            prompt = f"""
-            Database Schema:
-            {self.mcp_schema_cache}
-            
-            Question: {question}
-            
-            Please generate a SQL query to answer this question. Return only the SQL query, no explanations.
-            """
+            prompt = _QUERY_PROMPT_TEMPLATE.format(schema=schema, question=question)
             
             # Get SQL query from LLM
-            sql_query = self.llm_integration.invoke(prompt).strip()
+            sql_query = await self.llm_integration.ainvoke(prompt)
             
             # Clean up SQL query (remove markdown formatting if present)
-            if sql_query.startswith("```sql"):
-                sql_query = sql_query.replace("```sql", "").replace("```", "").strip()
-            elif sql_query.startswith("```"):
-                sql_query = sql_query.replace("```", "").strip()
+            fence_match = _SQL_FENCE_RE.match(sql_query)
+            sql_query = fence_match.group(1) if fence_match else sql_query.strip()
             
             # Execute SQL query using MCP tool
             result = await self.call_mcp_tool("query_database", query=sql_query, limit=max_results)
             
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            # Handle different result formats
+            # Normalize the tool result to a list of row dicts; scalars (including
+            # falsy ones) are wrapped as {"result": ...} so they still validate
             if isinstance(result, dict):
                 data = result.get("data", [])
-                row_count = result.get("row_count", len(data) if isinstance(data, list) else 0)
-            elif isinstance(result, list):
-                data = result
-                row_count = len(result)
+                row_count = result.get("row_count")
             else:
-                data = [{"result": str(result)}]
-                row_count = 1
+                data = result
+                row_count = None
+            if data is None:
+                data = []
+            elif not isinstance(data, list):
+                data = [data]
+            data = [row if isinstance(row, dict) else {"result": str(row)} for row in data]
+            if row_count is None:
+                row_count = len(data)
             
             return {
                 "success": True,
@@ -208,8 +266,8 @@ class MCPClient:
             }
             
         except Exception as e:
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-            logger.error(f"Error processing question '{question}': {e}")
+            execution_time = time.perf_counter() - start_time
+            logger.error("Error processing question '%s': %s", question, e)
             
             return {
                 "success": False,
@@ -87,6 +87,32 @@ class GeminiLLMWrapper:
             print(f"Error in GeminiLLMWrapper.invoke(): {error_msg}")
             return error_msg
     
+    async def ainvoke(self, prompt: str, **kwargs) -> str:
+        """
+        Invoke the Gemini model asynchronously with the given prompt.
+        
+        Args:
+            prompt: The input prompt for the model
+            **kwargs: Additional arguments (for compatibility with NailLLMLangchain)
+        
+        Returns:
+            The model's response as a string
+        """
+        try:
+            # Use the SDK's async client so the event loop is not blocked
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self.generation_config,
+                **kwargs
+            )
+            
+            return response.text
+            
+        except Exception as e:
+            error_msg = f"Gemini LLM error: {str(e)}"
+            print(f"Error in GeminiLLMWrapper.ainvoke(): {error_msg}")
+            return error_msg
+    
     def get_model_info(self) -> str:
         """
         Get information about the current model configuration.
@@ -5,13 +5,15 @@ This package contains all Pydantic models used across the application.
 """
 
 from .requests import AskLLMRequest
-from .responses import AskLLMResponse, HealthResponse
+from .responses import AskLLMResponse, HealthResponse, AskLLMResponseDict, HealthResponseDict
 from .config import MCPClientConfig, DatabaseConfig
 
 __all__ = [
     "AskLLMRequest",
     "AskLLMResponse", 
     "HealthResponse",
+    "AskLLMResponseDict",
+    "HealthResponseDict",
     "MCPClientConfig",
     "DatabaseConfig"
 ]
@@ -20,6 +20,15 @@ class MCPClientConfig:
         self.nail_model_id = os.getenv("NAIL_MODEL_ID", "claude-3.5")
         self.nail_temperature = float(os.getenv("NAIL_TEMPERATURE", "0.1"))
         self.nail_max_tokens = int(os.getenv("NAIL_MAX_TOKENS", "300"))
+        self.llm_warmup = os.getenv("LLM_WARMUP", "false").lower() == "true"
+        
+        # MCP connection configuration
+        self.mcp_max_concurrency = int(os.getenv("MCP_MAX_CONCURRENCY", "10"))
+        self.mcp_metadata_ttl = int(os.getenv("MCP_METADATA_TTL", "60"))
+        
+        # API configuration
+        self.validate_api_response = os.getenv("VALIDATE_API_RESPONSE", "false").lower() == "true"
+        self.cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
         
         # Debug: Print loaded configuration
         self._print_config()
@@ -35,6 +44,11 @@ class MCPClientConfig:
         print(f"   NAIL_MODEL_ID: {self.nail_model_id}")
         print(f"   NAIL_TEMPERATURE: {self.nail_temperature}")
         print(f"   NAIL_MAX_TOKENS: {self.nail_max_tokens}")
+        print(f"   LLM_WARMUP: {self.llm_warmup}")
+        print(f"   MCP_MAX_CONCURRENCY: {self.mcp_max_concurrency}")
+        print(f"   MCP_METADATA_TTL: {self.mcp_metadata_ttl}")
+        print(f"   VALIDATE_API_RESPONSE: {self.validate_api_response}")
+        print(f"   CORS_ORIGINS: {self.cors_origins or 'DISABLED'}")
     
     def normalize_server_url(self, url: str) -> str:
         """Normalize MCP server URL"""
@@ -1,11 +1,12 @@
 """
 Response models for MCP Client and Server
 
-This module contains all Pydantic response models used in the API endpoints.
+This module contains all Pydantic response models used in the API endpoints,
+plus TypedDict equivalents for handlers that return plain dicts.
 """
 
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TypedDict
 
 
 class AskLLMResponse(BaseModel):
@@ -24,3 +25,21 @@ class HealthResponse(BaseModel):
     status: str
     timestamp: str
     error: Optional[str] = None
+
+
+class AskLLMResponseDict(TypedDict):
+    """Plain-dict shape of AskLLMResponse, returned without validation"""
+    success: bool
+    question: str
+    sql_query: Optional[str]
+    data: Optional[List[Dict[str, Any]]]
+    row_count: Optional[int]
+    execution_time: Optional[float]
+    error: Optional[str]
+
+
+class HealthResponseDict(TypedDict):
+    """Plain-dict shape of HealthResponse, returned without validation"""
+    status: str
+    timestamp: str
+    error: Optional[str]
@@ -4,10 +4,13 @@ Database MCP Server module
 This module contains the main DatabaseMCPServer class.
 """
 
-import json
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import sys
+import threading
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
+import orjson
 from fastmcp import FastMCP
 
 from models.config import DatabaseConfig
@@ -17,13 +20,142 @@ from .schema_manager import SchemaManager
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool/resource payload to compact JSON"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+# Static catalogs served by the list_* tools and prompts resource; built once
+# at import instead of on every call
+_TOOL_CATALOG = {
+    "query_database": {
+        "name": "query_database",
+        "description": "Execute SQL queries on the database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "SQL query to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 1000}
+            },
+            "required": ["query"]
+        }
+    },
+    "query_database_batch": {
+        "name": "query_database_batch",
+        "description": "Execute several SQL queries in one call",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "queries": {"type": "array", "items": {"type": "string"}, "description": "SQL queries to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return per query", "default": 1000}
+            },
+            "required": ["queries"]
+        }
+    },
+    "refresh_schema": {
+        "name": "refresh_schema",
+        "description": "Refresh the database schema cache",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    "health_check": {
+        "name": "health_check",
+        "description": "Check database connection health",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+}
+
+_RESOURCE_CATALOG = {
+    "database://schema": {
+        "uri": "database://schema",
+        "name": "Database Schema",
+        "description": "Current database schema information",
+        "mimeType": "text/plain"
+    },
+    "server://info": {
+        "uri": "server://info",
+        "name": "Server Information",
+        "description": "MCP server information and status",
+        "mimeType": "application/json"
+    },
+    "prompts://database": {
+        "uri": "prompts://database",
+        "name": "Database Prompts",
+        "description": "Available database-related prompts",
+        "mimeType": "application/json"
+    }
+}
+
+# Single source for both the list_prompts catalog and the prompts://database
+# templates
+_PROMPTS = {
+    "generate_sql_query": {
+        "description": "Generate SQL query from natural language question",
+        "arguments": [
+            {"name": "question", "description": "Natural language question about the database", "required": True},
+            {"name": "table_context", "description": "Additional table context", "required": False}
+        ],
+        "template": "Given the database schema and question, generate a SQL query.\n\nSchema:\n{schema}\n\nQuestion: {question}\n\nSQL Query:"
+    },
+    "explain_query": {
+        "description": "Explain what a SQL query does",
+        "arguments": [
+            {"name": "query", "description": "SQL query to explain", "required": True}
+        ],
+        "template": "Explain what the following SQL query does:\n\n{query}\n\nExplanation:"
+    }
+}
+
+_PROMPT_CATALOG = {
+    name: {"name": name, "description": prompt["description"], "arguments": prompt["arguments"]}
+    for name, prompt in _PROMPTS.items()
+}
+
+_PROMPT_TEMPLATES = {
+    name: {"description": prompt["description"], "template": prompt["template"]}
+    for name, prompt in _PROMPTS.items()
+}
+
+# prompts://database has no per-call content, so it is serialized only once
+_PROMPT_TEMPLATES_JSON = _dumps(_PROMPT_TEMPLATES)
+
+# Startup banner, written in a single call by print_server_info
+_BANNER = """
+============================================================
+🗄️  Database MCP Server
+============================================================
+📊 Database: {db_type} - {db_name}
+🌐 Server: {host}:{port}
+📋 MCP Endpoint: http://{host}:{port}/mcp
+
+🔧 Available Tools:
+  • query_database - Execute SQL queries
+  • query_database_batch - Execute several SQL queries in one call
+  • refresh_schema - Refresh database schema cache
+  • health_check - Check database connection health
+
+📚 Available Resources:
+  • database://schema - Database schema information
+  • server://info - Server information
+  • prompts://database - Database-related prompts
+
+🚀 Server is ready to accept connections!
+============================================================
+"""
+
+
 class DatabaseMCPServer:
     """
     Generic Database MCP Server implementation.
     
     This server provides:
     - Database schema as MCP resource (database://schema)
-    - Query execution tool (query_database)
+    - Query execution tools (query_database, query_database_batch)
     - Schema refresh tool (refresh_schema)
     - Health monitoring
     - Support for multiple database types
@@ -38,6 +170,7 @@ class DatabaseMCPServer:
         # Initialize components
         self.db_ops = DatabaseOperations(self.config)
         self.schema_manager = SchemaManager(self.config, self.db_ops)
+        self._connect_lock = threading.Lock()
         
         # Setup logging
         logging.basicConfig(
@@ -51,6 +184,29 @@ class DatabaseMCPServer:
         self._register_resources()
         self._register_lifecycle_handlers()
     
+    def _ensure_connected(self) -> None:
+        """Connect to the database once, even when called from several worker threads"""
+        with self._connect_lock:
+            if not self.db_ops.engine:
+                self.db_ops.connect()
+    
+    def _execute_batch(self, queries: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Run queries in order, recording per-query errors instead of aborting the batch"""
+        results = []
+        for query in queries:
+            try:
+                result = self.db_ops.execute_query(query, limit)
+                results.append({
+                    "data": result["data"],
+                    "row_count": result["row_count"],
+                    "columns": result["columns"],
+                    "query": result["query"]
+                })
+            except Exception as e:
+                self.logger.error(f"Batch query failed: {e}")
+                results.append({"query": query, "error": str(e)})
+        return results
+    
     def create_mcp_response(self, content: Any, error: str = None, request_id: str = None) -> dict:
         """Create MCP-compliant response format"""
         self.request_id += 1
@@ -86,10 +242,10 @@ class DatabaseMCPServer:
                 
                 # Connect if not already connected
                 if not self.db_ops.engine:
-                    self.db_ops.connect()
+                    await asyncio.to_thread(self._ensure_connected)
                 
-                # Execute query
-                result = self.db_ops.execute_query(query, limit)
+                # Execute query off the event loop so other requests keep flowing
+                result = await asyncio.to_thread(self.db_ops.execute_query, query, limit)
                 
                 # Create MCP response
                 response = self.create_mcp_response({
@@ -99,12 +255,38 @@ class DatabaseMCPServer:
                     "query": result["query"]
                 })
                 
-                return json.dumps(response)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Query execution failed: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
+        
+        @self.mcp.tool()
+        async def query_database_batch(queries: List[str], limit: int = 1000) -> str:
+            """Execute several SQL queries in one call"""
+            try:
+                self.logger.info(f"Executing batch of {len(queries)} queries")
+                
+                # Connect if not already connected
+                if not self.db_ops.engine:
+                    await asyncio.to_thread(self._ensure_connected)
+                
+                # One worker thread runs the whole batch so it never holds more
+                # than one pooled connection at a time
+                results = await asyncio.to_thread(self._execute_batch, queries, limit)
+                
+                response = self.create_mcp_response({
+                    "results": results,
+                    "query_count": len(results)
+                })
+                
+                return _dumps(response)
+                
+            except Exception as e:
+                self.logger.error(f"Batch query execution failed: {e}")
+                error_response = self.create_mcp_response(None, str(e))
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def refresh_schema() -> str:
@@ -114,10 +296,10 @@ class DatabaseMCPServer:
                 
                 # Connect if not already connected
                 if not self.db_ops.engine:
-                    self.db_ops.connect()
+                    await asyncio.to_thread(self._ensure_connected)
                 
                 # Refresh schema
-                schema = self.schema_manager.refresh_schema()
+                schema = await asyncio.to_thread(self.schema_manager.refresh_schema)
                 
                 response = self.create_mcp_response({
                     "message": "Schema refreshed successfully",
@@ -125,12 +307,12 @@ class DatabaseMCPServer:
                     "cached_at": datetime.now(timezone.utc).isoformat()
                 })
                 
-                return json.dumps(response)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Schema refresh failed: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def health_check() -> str:
@@ -138,10 +320,10 @@ class DatabaseMCPServer:
             try:
                 # Connect if not already connected
                 if not self.db_ops.engine:
-                    self.db_ops.connect()
+                    await asyncio.to_thread(self._ensure_connected)
                 
                 # Perform health check
-                health = self.db_ops.health_check()
+                health = await asyncio.to_thread(self.db_ops.health_check)
                 
                 response = self.create_mcp_response({
                     "status": health["status"],
@@ -151,12 +333,12 @@ class DatabaseMCPServer:
                     "error": health.get("error")
                 })
                 
-                return json.dumps(response)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Health check failed: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
     
     def _register_resources(self):
         """Register MCP resources"""
@@ -165,7 +347,9 @@ class DatabaseMCPServer:
         async def get_database_schema() -> str:
             """Get the database schema"""
             try:
-                schema = self.schema_manager.get_schema()
+                # A cache miss reflects the database; keep that off the event loop.
+                # SchemaManager serializes misses, so concurrent readers share one load
+                schema = await asyncio.to_thread(self.schema_manager.get_schema)
                 return schema
             except Exception as e:
                 self.logger.error(f"Failed to get schema: {e}")
@@ -184,7 +368,7 @@ class DatabaseMCPServer:
                     "server_port": self.config.server_port,
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
-                return json.dumps(info, indent=2)
+                return _dumps(info)
             except Exception as e:
                 self.logger.error(f"Failed to get server info: {e}")
                 return f"Error retrieving server info: {str(e)}"
@@ -192,21 +376,7 @@ class DatabaseMCPServer:
         @self.mcp.resource("prompts://database")
         async def get_database_prompts() -> str:
             """Get database-related prompts"""
-            try:
-                prompts = {
-                    "generate_sql_query": {
-                        "description": "Generate SQL query from natural language",
-                        "template": "Given the database schema and question, generate a SQL query.\n\nSchema:\n{schema}\n\nQuestion: {question}\n\nSQL Query:"
-                    },
-                    "explain_query": {
-                        "description": "Explain what a SQL query does",
-                        "template": "Explain what the following SQL query does:\n\n{query}\n\nExplanation:"
-                    }
-                }
-                return json.dumps(prompts, indent=2)
-            except Exception as e:
-                self.logger.error(f"Failed to get prompts: {e}")
-                return f"Error retrieving prompts: {str(e)}"
+            return _PROMPT_TEMPLATES_JSON
     
     def _register_lifecycle_handlers(self):
         """Register MCP lifecycle handlers"""
@@ -215,107 +385,37 @@ class DatabaseMCPServer:
         async def list_tools() -> str:
             """List available MCP tools"""
             try:
-                tools = {
-                    "query_database": {
-                        "name": "query_database",
-                        "description": "Execute SQL queries on the database",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string", "description": "SQL query to execute"},
-                                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 1000}
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    "refresh_schema": {
-                        "name": "refresh_schema",
-                        "description": "Refresh the database schema cache",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    "health_check": {
-                        "name": "health_check",
-                        "description": "Check database connection health",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    }
-                }
-                
-                response = self.create_mcp_response(tools)
-                return json.dumps(response)
+                response = self.create_mcp_response(_TOOL_CATALOG)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Failed to list tools: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def list_resources() -> str:
             """List available MCP resources"""
             try:
-                resources = {
-                    "database://schema": {
-                        "uri": "database://schema",
-                        "name": "Database Schema",
-                        "description": "Current database schema information",
-                        "mimeType": "text/plain"
-                    },
-                    "server://info": {
-                        "uri": "server://info",
-                        "name": "Server Information",
-                        "description": "MCP server information and status",
-                        "mimeType": "application/json"
-                    },
-                    "prompts://database": {
-                        "uri": "prompts://database",
-                        "name": "Database Prompts",
-                        "description": "Available database-related prompts",
-                        "mimeType": "application/json"
-                    }
-                }
-                
-                response = self.create_mcp_response(resources)
-                return json.dumps(response)
+                response = self.create_mcp_response(_RESOURCE_CATALOG)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Failed to list resources: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
         
         @self.mcp.tool()
         async def list_prompts() -> str:
             """List available MCP prompts"""
             try:
-                prompts = {
-                    "generate_sql_query": {
-                        "name": "generate_sql_query",
-                        "description": "Generate SQL query from natural language question",
-                        "arguments": [
-                            {"name": "question", "description": "Natural language question about the database", "required": True},
-                            {"name": "table_context", "description": "Additional table context", "required": False}
-                        ]
-                    },
-                    "explain_query": {
-                        "name": "explain_query",
-                        "description": "Explain what a SQL query does",
-                        "arguments": [
-                            {"name": "query", "description": "SQL query to explain", "required": True}
-                        ]
-                    }
-                }
-                
-                response = self.create_mcp_response(prompts)
-                return json.dumps(response)
+                response = self.create_mcp_response(_PROMPT_CATALOG)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Failed to list prompts: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
     
     def start(self):
         """Start the MCP server"""
@@ -325,12 +425,20 @@ class DatabaseMCPServer:
             # Connect to database
             self.db_ops.connect()
             
-            # Start MCP server with streamable-http transport
-            self.mcp.run(
-                transport="streamable-http",
-                host=self.config.server_host,
-                port=self.config.server_port
-            )
+            # Start MCP server with streamable-http transport, on uvloop where available
+            if sys.platform == "win32":
+                self.mcp.run(
+                    transport="streamable-http",
+                    host=self.config.server_host,
+                    port=self.config.server_port
+                )
+            else:
+                import uvloop
+                uvloop.run(self.mcp.run_async(
+                    transport="streamable-http",
+                    host=self.config.server_host,
+                    port=self.config.server_port
+                ))
             
         except Exception as e:
             self.logger.error(f"Failed to start server: {e}")
@@ -351,19 +459,10 @@ class DatabaseMCPServer:
     
     def print_server_info(self):
         """Print server information"""
-        print("\n" + "="*60)
-        print("🗄️  Database MCP Server")
-        print("="*60)
-        print(f"📊 Database: {self.config.db_type.upper()} - {self.config.db_name}")
-        print(f"🌐 Server: {self.config.server_host}:{self.config.server_port}")
-        print(f"📋 MCP Endpoint: http://{self.config.server_host}:{self.config.server_port}/mcp")
-        print("\n🔧 Available Tools:")
-        print("  • query_database - Execute SQL queries")
-        print("  • refresh_schema - Refresh database schema cache")
-        print("  • health_check - Check database connection health")
-        print("\n📚 Available Resources:")
-        print("  • database://schema - Database schema information")
-        print("  • server://info - Server information")
-        print("  • prompts://database - Database-related prompts")
-        print("\n🚀 Server is ready to accept connections!")
-        print("="*60)
+        sys.stdout.write(_BANNER.format(
+            db_type=self.config.db_type.upper(),
+            db_name=self.config.db_name,
+            host=self.config.server_host,
+            port=self.config.server_port
+        ))
+        sys.stdout.flush()
@@ -6,6 +6,7 @@ This module handles database schema caching and management.
 
 import json
 import logging
+import threading
 from typing import Dict, Any, Optional
 from cachetools import TTLCache
 from datetime import datetime, timezone
@@ -22,15 +23,24 @@ class SchemaManager:
     def __init__(self, config: DatabaseConfig, db_ops: DatabaseOperations):
         self.config = config
         self.db_ops = db_ops
-        self.cache = TTLCache(maxsize=1000, ttl=config.schema_cache_ttl)
+        self.cache = TTLCache(maxsize=1, ttl=config.schema_cache_ttl)
         self._schema_cache_key = "database_schema"
+        # TTLCache is not thread-safe; the lock also makes concurrent misses
+        # reflect the schema only once
+        self._lock = threading.Lock()
     
     def get_schema(self, force_refresh: bool = False) -> str:
         """Get database schema, using cache if available"""
-        if not force_refresh and self._schema_cache_key in self.cache:
-            logger.debug("Returning cached schema")
-            return self.cache[self._schema_cache_key]
-        
+        with self._lock:
+            if not force_refresh:
+                schema_text = self.cache.get(self._schema_cache_key)
+                if schema_text is not None:
+                    logger.debug("Returning cached schema")
+                    return schema_text
+            return self._load_schema()
+    
+    def _load_schema(self) -> str:
+        """Reflect the schema from the database and cache the formatted text"""
         try:
             logger.info("Fetching fresh database schema")
             schema_info = self.db_ops.get_schema_info()
@@ -102,5 +112,6 @@ class SchemaManager:
     
     def clear_cache(self) -> None:
         """Clear the schema cache"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
         logger.info("Schema cache cleared")
@@ -0,0 +1,49 @@
+"""
+Async caching utilities
+
+This module provides a single-value TTL cache for metadata fetched from the MCP server.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+class AsyncTTLCache:
+    """
+    Single-value cache with a time-to-live and single-flight refresh.
+
+    Concurrent callers that miss the cache wait on one loader call instead of
+    each fetching the value themselves.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value: Optional[Any] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._value is not None and time.monotonic() < self._expires_at
+
+    async def get(self, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value, loading it if missing or expired
+
+        Args:
+            loader: Coroutine function producing a fresh value; errors are not cached
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if self._is_fresh():
+            return self._value
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._value
+
+            value = await loader()
+            self._value = value
+            self._expires_at = time.monotonic() + self.ttl
+            return value
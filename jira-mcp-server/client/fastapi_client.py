@@ -4,11 +4,13 @@ FastAPI Client module
 This module contains the FastAPIClient class for handling HTTP endpoints and app lifecycle.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from models.config import MCPClientConfig
 from models.requests import AskLLMRequest
@@ -33,7 +35,8 @@ class FastAPIClient:
             description="Minimal FastAPI client for natural language database queries",
             version="1.0.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            default_response_class=ORJSONResponse
         )
         
         # CORS middleware
@@ -115,22 +118,18 @@ class FastAPIClient:
         async def mcp_capabilities():
             """Get MCP server capabilities (tools, resources, prompts)"""
             try:
-                # Get tools
-                tools = await self.mcp_client.discover_mcp_tools()
-                
-                # Get resources
-                try:
-                    schema = await self.mcp_client.get_mcp_resource("database://schema")
-                    resources = {"database://schema": "Available"}
-                except:
-                    resources = {"database://schema": "Not available"}
+                # Discover tools, resources and prompts concurrently
+                tools, schema, prompts = await asyncio.gather(
+                    self.mcp_client.discover_mcp_tools(),
+                    self.mcp_client.get_mcp_resource("database://schema"),
+                    self.mcp_client.get_mcp_resource("prompts://database"),
+                    return_exceptions=True
+                )
+                if isinstance(tools, BaseException):
+                    raise tools
                 
-                # Get prompts (if available)
-                try:
-                    prompts = await self.mcp_client.get_mcp_resource("prompts://database")
-                    prompts_info = {"prompts://database": "Available"}
-                except:
-                    prompts_info = {"prompts://database": "Not available"}
+                resources = {"database://schema": "Not available" if isinstance(schema, BaseException) else "Available"}
+                prompts_info = {"prompts://database": "Not available" if isinstance(prompts, BaseException) else "Available"}
                 
                 return {
                     "tools": tools,
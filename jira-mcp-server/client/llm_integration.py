@@ -4,8 +4,11 @@ LLM Integration module
 This module handles LLM initialization and integration logic.
 """
 
+import asyncio
+import hashlib
 import logging
 from typing import Optional, Any
+from cachetools import LRUCache
 from models.config import MCPClientConfig
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,12 @@ class LLMIntegration:
         self.config = config
         self.llm_instance = None
         self._has_nail_llm = False
+        # Bounds in-flight LLM calls so concurrent requests stay within the provider's rate limit
+        self._semaphore = asyncio.Semaphore(config.llm_max_concurrency)
+        # Identical prompts (same schema and question) reuse the earlier completion
+        self._response_cache = LRUCache(maxsize=256) if config.llm_cache_enabled else None
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     async def initialize(self) -> None:
         """Initialize LLM instance"""
@@ -60,12 +69,48 @@ class LLMIntegration:
             logger.error(f"Failed to initialize NailLLMLangchain: {e}")
             raise
     
+    @staticmethod
+    def _prompt_key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    
     def invoke(self, prompt: str) -> str:
         """Invoke the LLM with a prompt"""
         if self.llm_instance is None:
             raise RuntimeError("LLM is not initialized")
         return self.llm_instance.invoke(prompt)
     
+    async def ainvoke(self, prompt: str) -> str:
+        """Invoke the LLM without blocking the event loop"""
+        if self.llm_instance is None:
+            raise RuntimeError("LLM is not initialized")
+        if self._response_cache is None:
+            return await self._ainvoke_uncached(prompt)
+        
+        key = self._prompt_key(prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._log_cache_ratio()
+            return cached
+        
+        self.cache_misses += 1
+        # Failed calls raise, so only clean completions reach the cache
+        response = await self._ainvoke_uncached(prompt)
+        if response:
+            self._response_cache[key] = response
+        self._log_cache_ratio()
+        return response
+    
+    async def _ainvoke_uncached(self, prompt: str) -> str:
+        async with self._semaphore:
+            if hasattr(self.llm_instance, "ainvoke"):
+                return await self.llm_instance.ainvoke(prompt)
+            return await asyncio.to_thread(self.llm_instance.invoke, prompt)
+    
+    def _log_cache_ratio(self) -> None:
+        total = self.cache_hits + self.cache_misses
+        logger.debug(f"LLM cache: {self.cache_hits}/{total} hits ({self.cache_hits / total:.0%})")
+    
     @property
     def is_initialized(self) -> bool:
         """Check if LLM is initialized"""
@@ -4,30 +4,73 @@ MCP Client module
 This module contains the MCPClient class for handling MCP operations.
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from fastmcp.client.transports import StreamableHttpTransport
 
 from models.config import MCPClientConfig
+from utils.question import normalize_question
 from .llm_integration import LLMIntegration
 
 logger = logging.getLogger(__name__)
 
+# Single read-only statements whose /ask_llm answers can be reused
+_READ_ONLY_QUERY_RE = re.compile(r"^\s*(select|show|describe|desc|explain)\b", re.IGNORECASE)
+
+# Statements that change data or schema; running one drops every cached answer
+_WRITE_QUERY_RE = re.compile(
+    r"(^|;)\s*(insert|update|delete|replace|merge|create|alter|drop|truncate|rename|grant|revoke)\b",
+    re.IGNORECASE
+)
+
+# The schema part of the SQL prompt is formatted once per schema load; only the
+# question is appended per request
+_SQL_PROMPT_PREFIX = "Database Schema:\n{schema}\n\nQuestion: "
+_SQL_PROMPT_SUFFIX = (
+    "\n\nPlease generate a SQL query to answer this question. "
+    "Return only the SQL query, no explanations."
+)
+
+
+def _is_read_only_query(query: str) -> bool:
+    """True for a single read-only statement"""
+    return bool(_READ_ONLY_QUERY_RE.match(query)) and ";" not in query.strip().rstrip(";")
+
+
+def _is_write_query(query: str) -> bool:
+    """True if any statement in the query writes"""
+    return bool(_WRITE_QUERY_RE.search(query))
+
+
 
 class MCPClient:
     """MCP Client class to handle all MCP operations and LLM interactions"""
     
     def __init__(self, config: MCPClientConfig):
         self.config = config
-        self.mcp_client_instance: Optional[Client] = None
-        self.mcp_tools_cache: Optional[Dict[str, Any]] = None
+        # Pool of persistent MCP connections checked out per call; a None slot
+        # marks a dropped connection that is reopened on its next checkout
+        self.mcp_clients: List[Client] = []
+        self._mcp_pool: Optional[asyncio.Queue] = None
         self.mcp_schema_cache: Optional[str] = None
+        self._sql_prompt_prefix: Optional[str] = None
+        self.ask_llm_cache = TTLCache(maxsize=256, ttl=config.ask_llm_cache_ttl)
+        # Bumped by every write, so answers in flight don't store stale rows
+        self._ask_llm_cache_epoch = 0
         self.llm_integration = LLMIntegration(config)
         
+        # Single-flight guard so concurrent first requests open one pool
+        self._pool_lock = asyncio.Lock()
+        
     async def startup(self):
         """Initialize MCP client and LLM instance"""
         try:
@@ -36,8 +79,15 @@ class MCPClient:
             # Initialize LLM
             await self.llm_integration.initialize()
             
-            # Don't initialize MCP client during startup - do it lazily when needed
-            logger.info("MCP Client startup completed successfully (MCP connection will be established on first use)")
+            # Open the MCP connection pool and build the prompt prefix now; if
+            # the server isn't up yet, both are retried on first use
+            try:
+                await self._get_mcp_pool()
+                await self._get_sql_prompt_prefix()
+            except Exception:
+                logger.info("MCP connection will be established on first use")
+            
+            logger.info("MCP Client startup completed successfully")
             
         except Exception as e:
             logger.error(f"Failed to start MCP Client: {e}")
@@ -45,38 +95,95 @@ class MCPClient:
     
     async def shutdown(self):
         """Cleanup MCP client connections"""
-        try:
-            if self.mcp_client_instance is not None:
-                await self.mcp_client_instance.__aexit__(None, None, None)
-                self.mcp_client_instance = None
-                logger.info("Closed persistent MCP client connection")
-        except Exception as e:
-            logger.error(f"Error during MCP Client shutdown: {e}")
+        clients, self.mcp_clients, self._mcp_pool = self.mcp_clients, [], None
+        for client in clients:
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception as e:
+                logger.error(f"Error during MCP Client shutdown: {e}")
+        if clients:
+            logger.info(f"Closed {len(clients)} persistent MCP client connection(s)")
+    
+    async def _open_mcp_client(self) -> Client:
+        """Open one persistent MCP client connection"""
+        server_url = self.config.normalize_server_url(self.config.mcp_server_url)
+        client = Client(StreamableHttpTransport(url=server_url))
+        await client.__aenter__()
+        return client
     
-    async def _initialize_mcp_client(self):
-        """Initialize MCP client connection"""
+    async def _close_mcp_client(self, client: Client) -> None:
+        """Close a pooled MCP client, ignoring errors from a broken transport"""
+        if client in self.mcp_clients:
+            self.mcp_clients.remove(client)
         try:
-            server_url = self.config.normalize_server_url(self.config.mcp_server_url)
-            transport = StreamableHttpTransport(url=server_url)
-            self.mcp_client_instance = Client(transport)
-            await self.mcp_client_instance.__aenter__()
-            logger.info(f"Created persistent MCP client connection to {server_url}")
-        except Exception as e:
-            logger.error(f"Failed to initialize MCP client: {e}")
+            await client.__aexit__(None, None, None)
+        except Exception:
+            pass
+    
+    async def _initialize_mcp_pool(self):
+        """Open MCP_POOL_SIZE persistent MCP client connections"""
+        server_url = self.config.normalize_server_url(self.config.mcp_server_url)
+        
+        # Connection handshakes are network-bound, so open them concurrently
+        results = await asyncio.gather(
+            *(self._open_mcp_client() for _ in range(self.config.mcp_pool_size)),
+            return_exceptions=True
+        )
+        clients: List[Client] = [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.error(f"Failed to initialize MCP client: {errors[0]}")
             logger.warning("MCP server may not be running. Some features will be unavailable.")
-            raise
+            for client in clients:
+                try:
+                    await client.__aexit__(None, None, None)
+                except Exception:
+                    pass
+            raise errors[0]
+        
+        pool: asyncio.Queue = asyncio.Queue()
+        for client in clients:
+            pool.put_nowait(client)
+        self.mcp_clients = clients
+        self._mcp_pool = pool
+        logger.info(f"Created {len(clients)} persistent MCP client connection(s) to {server_url}")
     
-    async def get_mcp_client(self) -> Client:
-        """Get MCP client instance"""
-        if self.mcp_client_instance is None:
-            await self._initialize_mcp_client()
-        return self.mcp_client_instance
+    async def _get_mcp_pool(self) -> asyncio.Queue:
+        """Get the MCP connection pool, opening it on first use"""
+        if self._mcp_pool is None:
+            async with self._pool_lock:
+                if self._mcp_pool is None:
+                    await self._initialize_mcp_pool()
+        return self._mcp_pool
+    
+    @asynccontextmanager
+    async def mcp_connection(self) -> AsyncIterator[Client]:
+        """Check out a pooled MCP client for the duration of one call"""
+        pool = await self._get_mcp_pool()
+        client = await pool.get()
+        try:
+            if client is None:
+                client = await self._open_mcp_client()
+                self.mcp_clients.append(client)
+            yield client
+        except ToolError:
+            # The tool failed, not the connection
+            raise
+        except Exception:
+            # The transport may be broken; drop the connection so the slot is
+            # reopened on its next checkout instead of failing every later call
+            if client is not None:
+                await self._close_mcp_client(client)
+                client = None
+            raise
+        finally:
+            pool.put_nowait(client)
     
     async def call_mcp_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Call MCP tool on the server using persistent FastMCP client"""
         try:
-            client = await self.get_mcp_client()
-            result = await client.call_tool(tool_name, kwargs)
+            async with self.mcp_connection() as client:
+                result = await client.call_tool(tool_name, kwargs)
             
             logger.debug(f"MCP tool {tool_name} raw result: {result}")
             logger.debug(f"Result type: {type(result)}")
@@ -87,7 +194,7 @@ class MCPClient:
                 logger.debug(f"MCP tool {tool_name} content text: {text}")
                 try:
                     # Handle MCP-compliant response format
-                    parsed = json.loads(text)
+                    parsed = orjson.loads(text)
                     logger.debug(f"MCP tool {tool_name} parsed: {parsed}")
                     logger.debug(f"Parsed type: {type(parsed)}")
                     
@@ -97,7 +204,7 @@ class MCPClient:
                         raise Exception(f"MCP Error: {parsed['error'].get('message', 'Unknown error')}")
                     else:
                         return parsed
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.debug(f"MCP tool {tool_name} JSON decode failed, returning as text")
                     return {"content": text}
             else:
@@ -111,8 +218,8 @@ class MCPClient:
     async def get_mcp_resource(self, uri: str) -> str:
         """Get MCP resource from the server"""
         try:
-            client = await self.get_mcp_client()
-            result = await client.read_resource(uri)
+            async with self.mcp_connection() as client:
+                result = await client.read_resource(uri)
             
             if hasattr(result, 'contents') and result.contents:
                 return result.contents[0].text
@@ -126,8 +233,8 @@ class MCPClient:
     async def discover_mcp_tools(self) -> Dict[str, Any]:
         """Discover available MCP tools from the server"""
         try:
-            client = await self.get_mcp_client()
-            result = await client.list_tools()
+            async with self.mcp_connection() as client:
+                result = await client.list_tools()
             
             if hasattr(result, 'tools'):
                 tools = {}
@@ -145,10 +252,26 @@ class MCPClient:
             logger.error(f"Error discovering MCP tools: {e}")
             return {}
     
+    async def _get_sql_prompt_prefix(self) -> str:
+        """Get the schema part of the SQL prompt, fetching the schema on first use"""
+        if self._sql_prompt_prefix is None:
+            if self.mcp_schema_cache is None:
+                self.mcp_schema_cache = await self.get_mcp_resource("database://schema")
+            self._sql_prompt_prefix = _SQL_PROMPT_PREFIX.format(schema=self.mcp_schema_cache)
+        return self._sql_prompt_prefix
+    
     async def ask_llm(self, question: str, max_results: int = 100) -> Dict[str, Any]:
         """Process natural language question using LLM and MCP tools"""
-        start_time = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
+        
+        cache_key = (normalize_question(question), max_results)
+        cached = self.ask_llm_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Returning cached answer for question '{question}'")
+            execution_time = time.perf_counter() - start_time
+            return {**cached, "question": question, "execution_time": execution_time}
         
+        epoch = self._ask_llm_cache_epoch
         try:
             # Debug logging
             logger.info(f"LLM instance status: {self.llm_integration.is_initialized}")
@@ -158,22 +281,11 @@ class MCPClient:
             if not self.llm_integration.is_initialized:
                 raise HTTPException(status_code=500, detail="LLM is not configured")
             
-            # Get database schema
-            if self.mcp_schema_cache is None:
-                self.mcp_schema_cache = await self.get_mcp_resource("database://schema")
-            
             # Create prompt for LLM
-            prompt = f"""
-            Database Schema:
-            {self.mcp_schema_cache}
-            
-            Question: {question}
-            
-            Please generate a SQL query to answer this question. Return only the SQL query, no explanations.
-            """
+            prompt = await self._get_sql_prompt_prefix() + question + _SQL_PROMPT_SUFFIX
             
             # Get SQL query from LLM
-            sql_query = self.llm_integration.invoke(prompt).strip()
+            sql_query = (await self.llm_integration.ainvoke(prompt)).strip()
             
             # Clean up SQL query (remove markdown formatting if present)
             if sql_query.startswith("```sql"):
@@ -181,10 +293,16 @@ class MCPClient:
             elif sql_query.startswith("```"):
                 sql_query = sql_query.replace("```", "").strip()
             
-            # Execute SQL query using MCP tool
-            result = await self.call_mcp_tool("query_database", query=sql_query, limit=max_results)
+            # Execute SQL query using MCP tool; a write drops every cached answer
+            # even if it fails part way
+            try:
+                result = await self.call_mcp_tool("query_database", query=sql_query, limit=max_results)
+            finally:
+                if _is_write_query(sql_query):
+                    self._ask_llm_cache_epoch += 1
+                    self.ask_llm_cache.clear()
             
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # Handle different result formats
             if isinstance(result, dict):
@@ -197,7 +315,7 @@ class MCPClient:
                 data = [{"result": str(result)}]
                 row_count = 1
             
-            return {
+            response = {
                 "success": True,
                 "question": question,
                 "sql_query": sql_query,
@@ -206,9 +324,13 @@ class MCPClient:
                 "execution_time": execution_time,
                 "error": None
             }
+            # Answers that ran a write must execute again when asked again
+            if _is_read_only_query(sql_query) and epoch == self._ask_llm_cache_epoch:
+                self.ask_llm_cache[cache_key] = response
+            return response
             
         except Exception as e:
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Error processing question '{question}': {e}")
             
             return {
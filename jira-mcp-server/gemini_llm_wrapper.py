@@ -87,6 +87,35 @@ class GeminiLLMWrapper:
             print(f"Error in GeminiLLMWrapper.invoke(): {error_msg}")
             return error_msg
     
+    async def ainvoke(self, prompt: str, **kwargs) -> str:
+        """
+        Invoke the Gemini model asynchronously with the given prompt.
+        
+        Args:
+            prompt: The input prompt for the model
+            **kwargs: Additional arguments (for compatibility with NailLLMLangchain)
+        
+        Returns:
+            The model's response as a string
+        
+        Raises:
+            Exception: Any error from the Gemini API, so callers never mistake
+                an error message for a completion
+        """
+        try:
+            # Use the SDK's async client so the event loop is not blocked
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self.generation_config,
+                **kwargs
+            )
+            
+            return response.text
+            
+        except Exception as e:
+            print(f"Error in GeminiLLMWrapper.ainvoke(): Gemini LLM error: {str(e)}")
+            raise
+    
     def get_model_info(self) -> str:
         """
         Get information about the current model configuration.
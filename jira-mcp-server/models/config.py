@@ -20,6 +20,10 @@ class MCPClientConfig:
         self.nail_model_id = os.getenv("NAIL_MODEL_ID", "claude-3.5")
         self.nail_temperature = float(os.getenv("NAIL_TEMPERATURE", "0.1"))
         self.nail_max_tokens = int(os.getenv("NAIL_MAX_TOKENS", "300"))
+        self.llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        self.mcp_pool_size = max(1, int(os.getenv("MCP_POOL_SIZE", "8")))
+        self.ask_llm_cache_ttl = int(os.getenv("ASK_LLM_CACHE_TTL", "300"))
+        self.llm_cache_enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
         
         # Debug: Print loaded configuration
         self._print_config()
@@ -30,11 +34,15 @@ class MCPClientConfig:
         print(f"   MCP_SERVER_URL: {self.mcp_server_url}")
         print(f"   CLIENT_HOST: {self.client_host}")
         print(f"   CLIENT_PORT: {self.client_port}")
+        print(f"   MCP_POOL_SIZE: {self.mcp_pool_size}")
+        print(f"   ASK_LLM_CACHE_TTL: {self.ask_llm_cache_ttl}")
+        print(f"   LLM_CACHE_ENABLED: {self.llm_cache_enabled}")
         print(f"   GOOGLE_API_KEY: {'***' if self.google_api_key else 'NOT SET'}")
         print(f"   GEMINI_MODEL_ID: {self.gemini_model_id}")
         print(f"   NAIL_MODEL_ID: {self.nail_model_id}")
         print(f"   NAIL_TEMPERATURE: {self.nail_temperature}")
         print(f"   NAIL_MAX_TOKENS: {self.nail_max_tokens}")
+        print(f"   LLM_MAX_CONCURRENCY: {self.llm_max_concurrency}")
     
     def normalize_server_url(self, url: str) -> str:
         """Normalize MCP server URL"""
@@ -4,10 +4,10 @@ JIRA MCP Server module
 This module contains the main JiraMCPServer class.
 """
 
-import json
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
+import orjson
 from fastmcp import FastMCP
 
 from models.config import JiraConfig
@@ -16,6 +16,11 @@ from .jira_operations import JiraOperations
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any, option: int = 0) -> str:
+    """Serialize an MCP payload to JSON with orjson"""
+    return orjson.dumps(obj, default=str, option=option).decode()
+
+
 class JiraMCPServer:
     """
     JIRA MCP Server implementation.
@@ -84,12 +89,12 @@ class JiraMCPServer:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 })
                 
-                return json.dumps(response)
+                return _dumps(response)
                 
             except Exception as e:
                 self.logger.error(f"Health check failed: {e}")
                 error_response = self.create_mcp_response(None, str(e))
-                return json.dumps(error_response)
+                return _dumps(error_response)
     
     def _register_resources(self):
         """Register MCP resources"""
@@ -106,7 +111,7 @@ class JiraMCPServer:
                     "server_port": self.config.server_port,
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
-                return json.dumps(info, indent=2)
+                return _dumps(info, orjson.OPT_INDENT_2)
             except Exception as e:
                 self.logger.error(f"Failed to get server info: {e}")
                 return f"Error retrieving server info: {str(e)}"
@@ -0,0 +1,38 @@
+"""
+Tests for the /ask_llm question cache key
+
+These pin which phrasings share a cached answer and which must not.
+"""
+
+import pytest
+
+from utils.question import normalize_question
+
+
+@pytest.mark.parametrize("question", [
+    "open bugs in PROJ",
+    "Show me open bugs in PROJ",
+    "Please show me open bugs in PROJ",
+    "Can you please show me open bugs in PROJ",
+    "  show   ME open bugs in proj ",
+])
+def test_request_phrases_collide(question):
+    assert normalize_question(question) == "open bugs in proj"
+
+
+@pytest.mark.parametrize("first, second", [
+    ("age > 30", "age < 30"),
+    ("Are there open bugs", "there open bugs"),
+    ("list users", "users"),
+    ("show users", "users"),
+    ("all open bugs", "open bugs"),
+    ("What is the oldest bug", "the oldest bug"),
+    ("open bugs?", "open bugs"),
+])
+def test_distinct_questions_do_not_collide(first, second):
+    assert normalize_question(first) != normalize_question(second)
+
+
+def test_request_phrase_alone_is_kept():
+    assert normalize_question("Show me") == "show me"
+    assert normalize_question("please") == "please"
@@ -6,8 +6,10 @@ This package contains common utilities used across the application.
 
 from .env_loader import load_environment
 from .logging_config import setup_logging
+from .question import normalize_question
 
 __all__ = [
     "load_environment",
-    "setup_logging"
+    "setup_logging",
+    "normalize_question"
 ]
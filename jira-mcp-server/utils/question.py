@@ -0,0 +1,44 @@
+"""
+Question normalization utilities
+
+This module builds the cache key under which equivalent questions share an answer.
+"""
+
+# Leading request phrases that only make a question polite; any word that could
+# narrow what is asked for ("list", "all", "are", ...) is kept
+_REQUEST_PHRASES = (
+    ("please",),
+    ("can", "you"),
+    ("could", "you"),
+    ("would", "you"),
+    ("show", "me"),
+    ("give", "me"),
+    ("tell", "me"),
+)
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for use as a cache key
+
+    Case and whitespace are folded and leading request phrases are dropped.
+    Everything else, including operators and punctuation, is kept so that
+    questions such as "age > 30" and "age < 30" never share an entry.
+
+    Args:
+        question: Natural language question
+
+    Returns:
+        str: Normalized question
+    """
+    words = question.lower().split()
+    start = 0
+    stripped = True
+    while stripped:
+        stripped = False
+        for phrase in _REQUEST_PHRASES:
+            end = start + len(phrase)
+            if end < len(words) and tuple(words[start:end]) == phrase:
+                start = end
+                stripped = True
+    return " ".join(words[start:])